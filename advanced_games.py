@@ -1,15 +1,94 @@
 import discord
-from discord.ext import commands
+from discord.ext import commands, tasks
 from discord import app_commands
 import logging
 import json
 import os
 import random
-from datetime import datetime, timedelta
+import time
+import heapq
+from collections import namedtuple
+from operator import itemgetter
+from datetime import datetime
 import asyncio
+import weakref
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+LEADERBOARD_TTL = 30  # seconds
+
+# Common fast-fail replies
+NO_CHAR_MSG = "❌ Start your adventure first with `/rpg_start`!"
+NO_PROFILE_MSG = "❌ Character not found! Use `/rpg_start` to begin your adventure."
+
+# category -> (player stat, embed title)
+LEADERBOARD_CATEGORIES = {
+    "level": ("level", "🏆 Level Leaderboard"),
+    "gold": ("gold", "💰 Gold Leaderboard"),
+    "pvp": ("pvp_wins", "⚔️ PvP Wins Leaderboard")
+}
+
+def _dumps(data) -> bytes:
+    """Serialize data as compact JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode()
+
+def _loads(raw: bytes):
+    """Parse JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+ClassStats = namedtuple("ClassStats", "hp attack defense speed emoji")
+ItemStats = namedtuple("ItemStats", "price emoji attack defense", defaults=(0, 0))
+MonsterStats = namedtuple("MonsterStats", "hp attack defense exp gold emoji speed", defaults=(10,))
+
+def _format_combat_event(event: tuple, monster_title: str) -> str:
+    """Render a (by_player, damage, hp_left) quest log entry"""
+    by_player, damage, hp_left = event
+    if by_player:
+        return f"⚔️ You deal {damage} damage! Monster HP: {hp_left}"
+    return f"👹 {monster_title} deals {damage} damage! Your HP: {hp_left}"
+
+def resolve_combat(first_hp: int, first_damage: int, second_hp: int, second_damage: int, max_turns: int) -> tuple:
+    """Resolve a fixed-damage duel in closed form.
+    
+    The first fighter strikes first every turn. Returns the hit counts
+    (first_hits, second_hits) the turn-by-turn simulation would produce.
+    """
+    if first_hp <= 0 or second_hp <= 0:
+        return 0, 0
+    
+    # Hits each side needs to finish the other (ceiling division)
+    first_needs = -(-second_hp // first_damage)
+    second_needs = -(-first_hp // second_damage)
+    
+    if first_needs <= second_needs and first_needs <= max_turns:
+        return first_needs, first_needs - 1
+    if second_needs < first_needs and second_needs <= max_turns:
+        return second_needs, second_needs
+    return max_turns, max_turns
+
+def combat_events(first_hp: int, first_damage: int, second_hp: int, second_damage: int,
+                  first_hits: int, second_hits: int, last: int):
+    """Yield the final `last` hits of a resolved duel.
+    
+    Each event is (by_first, damage, defender_hp_left) with hp clamped at 0.
+    """
+    total = first_hits + second_hits
+    for i in range(max(0, total - last), total):
+        hit = i // 2 + 1
+        if i % 2 == 0:
+            yield True, first_damage, max(0, second_hp - hit * first_damage)
+        else:
+            yield False, second_damage, max(0, first_hp - hit * second_damage)
+
 class AdvancedGamesCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
@@ -26,6 +105,37 @@ class AdvancedGamesCog(commands.Cog):
         self._init_file(self.dungeon_file, {})
         self._init_file(self.guild_battles_file, {})
         
+        # Load data into memory once; dirty caches are flushed by flush_loop
+        self._cache_files = {
+            "rpg": self.rpg_file,
+            "dungeon": self.dungeon_file,
+            "guild_battles": self.guild_battles_file
+        }
+        self._caches = {name: self._read_json(path) for name, path in self._cache_files.items()}
+        # Snowflakes stay ints in memory; json.dumps stringifies the keys on flush
+        self._rpg_cache = self._caches["rpg"] = {
+            int(guild_id): {int(user_id): player for user_id, player in players.items()}
+            for guild_id, players in self._caches["rpg"].items()
+        }
+        # Older saves carried memoized stat totals; they are derived, so drop them
+        for players in self._rpg_cache.values():
+            for player in players.values():
+                player.pop("_total_attack", None)
+                player.pop("_total_defense", None)
+        self._dungeon_cache = self._caches["dungeon"]
+        self._guild_battles_cache = self._caches["guild_battles"]
+        self._dirty = set()
+        self._flush_lock = asyncio.Lock()  # One writer per file, so unload waits out an in-flight flush
+        
+        # Serializes RPG mutations per (guild_id, user_id); a lock is dropped once nobody holds or waits on it
+        self._user_locks = weakref.WeakValueDictionary()
+        
+        # (guild_id, category) -> (built_at, top players)
+        self._lb_cache = {}
+        
+        # (guild_id, user_id) -> (attack, defense) including equipment; kept off the saved player data
+        self._stats_cache = {}
+        
         # Game configuration
         self.character_classes = {
             "warrior": {"hp": 120, "attack": 15, "defense": 12, "speed": 8, "emoji": "⚔️"},
@@ -34,6 +144,7 @@ class AdvancedGamesCog(commands.Cog):
             "rogue": {"hp": 90, "attack": 16, "defense": 7, "speed": 18, "emoji": "🗡️"},
             "paladin": {"hp": 140, "attack": 12, "defense": 16, "speed": 6, "emoji": "🛡️"}
         }
+        self.character_classes = {name: ClassStats(**stats) for name, stats in self.character_classes.items()}
         
         self.equipment = {
             "weapons": {
@@ -50,6 +161,17 @@ class AdvancedGamesCog(commands.Cog):
                 "dragon_scale": {"defense": 30, "price": 2500, "emoji": "🐉"}
             }
         }
+        self.equipment = {
+            category: {name: ItemStats(**stats) for name, stats in items.items()}
+            for category, items in self.equipment.items()
+        }
+        
+        # Flat item name -> (category, info) lookup for purchases
+        self.item_index = {
+            name: (category, info)
+            for category, items in self.equipment.items()
+            for name, info in items.items()
+        }
         
         self.monsters = {
             "goblin": {"hp": 30, "attack": 8, "defense": 3, "exp": 15, "gold": 25, "emoji": "👹"},
@@ -58,29 +180,81 @@ class AdvancedGamesCog(commands.Cog):
             "dragon": {"hp": 200, "attack": 30, "defense": 20, "exp": 150, "gold": 500, "emoji": "🐉"},
             "demon_lord": {"hp": 350, "attack": 45, "defense": 25, "exp": 300, "gold": 1000, "emoji": "👹"}
         }
+        self.monsters = {name: MonsterStats(**stats) for name, stats in self.monsters.items()}
+        
+        self._monster_names = tuple(self.monsters)
+        
+        # Display names and shop fields never change, so render them once
+        self._class_display = {name: name.title() for name in self.character_classes}
+        self._item_display = {name: name.replace("_", " ").title() for name in self.item_index}
+        self._monster_display = {name: name.title() for name in self.monsters}
+        self._shop_fields = {}
+        for category, items in self.equipment.items():
+            stat_key, stat_name = ("attack", "Attack") if category == "weapons" else ("defense", "Defense")
+            self._shop_fields[category] = [
+                (f"{info.emoji} {self._item_display[name]}",
+                 f"**{stat_name}:** +{getattr(info, stat_key)}\n**Price:** {info.price} gold")
+                for name, info in items.items()
+            ]
+        
+        # Start the background writer
+        self.flush_loop.start()
 
     def _init_file(self, file_path: str, default_data: dict):
         """Initialize a JSON file with default data if it doesn't exist"""
         if not os.path.exists(file_path):
-            with open(file_path, 'w') as f:
-                json.dump(default_data, f, indent=2)
+            self._write_file(file_path, _dumps(default_data))
 
     def _read_json(self, file_path: str) -> dict:
         """Read JSON data from file"""
         try:
-            with open(file_path, 'r') as f:
-                return json.load(f)
+            with open(file_path, 'rb') as f:
+                return _loads(f.read())
         except (FileNotFoundError, json.JSONDecodeError):
             return {}
 
-    def _write_json(self, file_path: str, data: dict):
-        """Write JSON data to file"""
-        with open(file_path, 'w') as f:
-            json.dump(data, f, indent=2)
+    def _write_file(self, file_path: str, payload: bytes):
+        """Write serialized data to file, swapping it in whole so a crash can't leave it truncated"""
+        tmp_path = file_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, file_path)
+
+    async def _flush(self):
+        """Write every dirty cache to disk without blocking the event loop"""
+        async with self._flush_lock:
+            while self._dirty:
+                name = self._dirty.pop()
+                # Serialize on the loop so the cache can't change mid-dump
+                payload = _dumps(self._caches[name])
+                try:
+                    await asyncio.to_thread(self._write_file, self._cache_files[name], payload)
+                except OSError as e:
+                    logger.error(f"Error writing {self._cache_files[name]}: {e}")
+                    self._dirty.add(name)
+                    break
+
+    @tasks.loop(seconds=5)
+    async def flush_loop(self):
+        """Periodically persist dirty RPG data"""
+        # Shielded so cancelling the loop lets a running flush finish and keep the lock until it does
+        await asyncio.shield(self._flush())
+
+    async def cog_unload(self):
+        """Stop the writer and persist pending changes"""
+        self.flush_loop.cancel()
+        await self._flush()
 
-    def _get_player_data(self, user_id: str, guild_id: str) -> dict:
+    def _get_player_or_none(self, user_id: int, guild_id: int) -> dict:
+        """Get player RPG data, or None if the user has no character"""
+        player_data = self._rpg_cache.get(guild_id, {}).get(user_id)
+        if player_data is None or not player_data["character_class"]:
+            return None
+        return player_data
+
+    def _get_or_create_player(self, user_id: int, guild_id: int) -> dict:
         """Get or create player RPG data"""
-        rpg_data = self._read_json(self.rpg_file)
+        rpg_data = self._rpg_cache
         
         if guild_id not in rpg_data:
             rpg_data[guild_id] = {}
@@ -105,59 +279,120 @@ class AdvancedGamesCog(commands.Cog):
                 "pvp_losses": 0,
                 "achievements": []
             }
-            self._write_json(self.rpg_file, rpg_data)
+            self._dirty.add("rpg")
         
         return rpg_data[guild_id][user_id]
 
-    def _save_player_data(self, user_id: str, guild_id: str, player_data: dict):
+    def _effective_stats(self, user_id: int, guild_id: int, player_data: dict) -> tuple:
+        """Get attack and defense including equipment, memoized per player"""
+        key = (guild_id, user_id)
+        totals = self._stats_cache.get(key)
+        if totals is None:
+            total_attack = player_data["attack"]
+            total_defense = player_data["defense"]
+            if player_data["weapon"]:
+                total_attack += self.equipment["weapons"][player_data["weapon"]].attack
+            if player_data["armor"]:
+                total_defense += self.equipment["armor"][player_data["armor"]].defense
+            totals = self._stats_cache[key] = (total_attack, total_defense)
+        return totals
+
+    def _user_lock(self, user_id: int, guild_id: int) -> asyncio.Lock:
+        """Get the lock serializing a player's RPG mutations"""
+        key = (guild_id, user_id)
+        lock = self._user_locks.get(key)
+        if lock is None:
+            lock = self._user_locks[key] = asyncio.Lock()
+        return lock
+
+    def _invalidate_stats(self, user_id: int, guild_id: int):
+        """Drop memoized totals after base stats or equipment change"""
+        self._stats_cache.pop((guild_id, user_id), None)
+
+    def _save_player_data(self, user_id: int, guild_id: int, player_data: dict):
         """Save player RPG data"""
-        rpg_data = self._read_json(self.rpg_file)
+        rpg_data = self._rpg_cache
         if guild_id not in rpg_data:
             rpg_data[guild_id] = {}
         rpg_data[guild_id][user_id] = player_data
-        self._write_json(self.rpg_file, rpg_data)
+        self._mark_dirty(guild_id)
+
+    def _mark_dirty(self, guild_id: int):
+        """Flag cached RPG data as changed after in-place player mutations"""
+        self._dirty.add("rpg")
+        self._invalidate_leaderboard(guild_id)
+
+    def _invalidate_leaderboard(self, guild_id: int):
+        """Drop cached leaderboards for a guild"""
+        for category in LEADERBOARD_CATEGORIES:
+            self._lb_cache.pop((guild_id, category), None)
+
+    def _get_leaderboard(self, guild_id: int, category: str) -> list:
+        """Get the cached top 10 (user, player_data) pairs for a category"""
+        key = (guild_id, category)
+        now = time.monotonic()
+        cached = self._lb_cache.get(key)
+        if cached and now - cached[0] < LEADERBOARD_TTL:
+            return cached[1]
+        
+        get_user = self.bot.get_user
+        players = []
+        for user_id, player_data in self._rpg_cache.get(guild_id, {}).items():
+            if player_data.get("character_class"):
+                user = get_user(user_id)
+                if user:
+                    players.append((user, player_data))
+        
+        stat = LEADERBOARD_CATEGORIES[category][0]
+        stat_of = itemgetter(stat)
+        top = heapq.nlargest(10, players, key=lambda entry: stat_of(entry[1]))
+        self._lb_cache[key] = (now, top)
+        return top
 
     @app_commands.command(name="rpg_start", description="Start your RPG adventure by choosing a character class")
     @app_commands.describe(character_class="Choose your character class")
+    @app_commands.choices(character_class=[
+        app_commands.Choice(name="⚔️ Warrior", value="warrior"),
+        app_commands.Choice(name="🔮 Mage", value="mage"),
+        app_commands.Choice(name="🏹 Archer", value="archer"),
+        app_commands.Choice(name="🗡️ Rogue", value="rogue"),
+        app_commands.Choice(name="🛡️ Paladin", value="paladin")
+    ])
     async def rpg_start(self, interaction: discord.Interaction, character_class: str):
         """Start RPG adventure"""
-        user_id = str(interaction.user.id)
-        guild_id = str(interaction.guild.id)
-        
-        if character_class.lower() not in self.character_classes:
-            classes_list = ", ".join(self.character_classes.keys())
-            await interaction.response.send_message(f"❌ Invalid class! Choose from: {classes_list}", ephemeral=True)
-            return
+        user_id = interaction.user.id
+        guild_id = interaction.guild.id
         
-        player_data = self._get_player_data(user_id, guild_id)
+        player_data = self._get_or_create_player(user_id, guild_id)
         
         if player_data["character_class"]:
             await interaction.response.send_message("❌ You already have a character! Use `/rpg_profile` to view your stats.", ephemeral=True)
             return
         
         # Set character class and base stats
-        class_info = self.character_classes[character_class.lower()]
-        player_data["character_class"] = character_class.lower()
-        player_data["max_hp"] = class_info["hp"]
-        player_data["hp"] = class_info["hp"]
-        player_data["attack"] = class_info["attack"]
-        player_data["defense"] = class_info["defense"]
-        player_data["speed"] = class_info["speed"]
+        class_info = self.character_classes[character_class]
+        player_data["character_class"] = character_class
+        player_data["max_hp"] = class_info.hp
+        player_data["hp"] = class_info.hp
+        player_data["attack"] = class_info.attack
+        player_data["defense"] = class_info.defense
+        player_data["speed"] = class_info.speed
+        self._invalidate_stats(user_id, guild_id)
         
         self._save_player_data(user_id, guild_id, player_data)
         
         embed = discord.Embed(
             title=f"🎮 Welcome to the RPG Adventure!",
-            description=f"{interaction.user.mention} has chosen the **{character_class.title()}** class!",
+            description=f"{interaction.user.mention} has chosen the **{self._class_display[character_class]}** class!",
             color=discord.Color.green()
         )
         
         embed.add_field(
-            name=f"{class_info['emoji']} Your Stats",
-            value=f"**HP:** {class_info['hp']}\n"
-                  f"**Attack:** {class_info['attack']}\n"
-                  f"**Defense:** {class_info['defense']}\n"
-                  f"**Speed:** {class_info['speed']}\n"
+            name=f"{class_info.emoji} Your Stats",
+            value=f"**HP:** {class_info.hp}\n"
+                  f"**Attack:** {class_info.attack}\n"
+                  f"**Defense:** {class_info.defense}\n"
+                  f"**Speed:** {class_info.speed}\n"
                   f"**Gold:** 100",
             inline=True
         )
@@ -177,37 +412,28 @@ class AdvancedGamesCog(commands.Cog):
     async def rpg_profile(self, interaction: discord.Interaction, user: discord.Member = None):
         """View RPG character profile"""
         target_user = user or interaction.user
-        user_id = str(target_user.id)
-        guild_id = str(interaction.guild.id)
+        user_id = target_user.id
+        guild_id = interaction.guild.id
         
-        player_data = self._get_player_data(user_id, guild_id)
+        player_data = self._get_player_or_none(user_id, guild_id)
         
-        if not player_data["character_class"]:
-            await interaction.response.send_message("❌ Character not found! Use `/rpg_start` to begin your adventure.", ephemeral=True)
+        if player_data is None:
+            await interaction.response.send_message(NO_PROFILE_MSG, ephemeral=True)
             return
         
         class_info = self.character_classes[player_data["character_class"]]
         
         # Calculate total stats with equipment
-        total_attack = player_data["attack"]
-        total_defense = player_data["defense"]
-        
-        if player_data["weapon"]:
-            weapon_info = self.equipment["weapons"][player_data["weapon"]]
-            total_attack += weapon_info["attack"]
-        
-        if player_data["armor"]:
-            armor_info = self.equipment["armor"][player_data["armor"]]
-            total_defense += armor_info["defense"]
+        total_attack, total_defense = self._effective_stats(user_id, guild_id, player_data)
         
         embed = discord.Embed(
-            title=f"{class_info['emoji']} {target_user.display_name}'s RPG Profile",
+            title=f"{class_info.emoji} {target_user.display_name}'s RPG Profile",
             color=discord.Color.blue()
         )
         
         embed.add_field(
             name="📊 Character Info",
-            value=f"**Class:** {player_data['character_class'].title()}\n"
+            value=f"**Class:** {self._class_display[player_data['character_class']]}\n"
                   f"**Level:** {player_data['level']}\n"
                   f"**EXP:** {player_data['exp']}/100\n"
                   f"**Gold:** {player_data['gold']:,}",
@@ -223,8 +449,8 @@ class AdvancedGamesCog(commands.Cog):
             inline=True
         )
         
-        equipment_text = "**Weapon:** " + (player_data["weapon"].replace("_", " ").title() if player_data["weapon"] else "None") + "\n"
-        equipment_text += "**Armor:** " + (player_data["armor"].replace("_", " ").title() if player_data["armor"] else "None")
+        equipment_text = "**Weapon:** " + (self._item_display[player_data["weapon"]] if player_data["weapon"] else "None") + "\n"
+        equipment_text += "**Armor:** " + (self._item_display[player_data["armor"]] if player_data["armor"] else "None")
         
         embed.add_field(
             name="🎒 Equipment",
@@ -255,175 +481,151 @@ class AdvancedGamesCog(commands.Cog):
     @app_commands.command(name="rpg_quest", description="Go on a quest to fight monsters and gain experience")
     async def rpg_quest(self, interaction: discord.Interaction):
         """Go on a quest"""
-        user_id = str(interaction.user.id)
-        guild_id = str(interaction.guild.id)
+        user_id = interaction.user.id
+        guild_id = interaction.guild.id
         
-        player_data = self._get_player_data(user_id, guild_id)
-        
-        if not player_data["character_class"]:
-            await interaction.response.send_message("❌ Start your adventure first with `/rpg_start`!", ephemeral=True)
-            return
-        
-        # Check cooldown
-        if player_data["quest_cooldown"]:
-            cooldown_time = datetime.fromisoformat(player_data["quest_cooldown"])
-            if datetime.now() < cooldown_time:
-                remaining = cooldown_time - datetime.now()
-                await interaction.response.send_message(f"⏰ Quest cooldown: {remaining.seconds}s remaining", ephemeral=True)
+        async with self._user_lock(user_id, guild_id):
+            player_data = self._get_player_or_none(user_id, guild_id)
+            
+            if player_data is None:
+                await interaction.response.send_message(NO_CHAR_MSG, ephemeral=True)
                 return
-        
-        # Random monster encounter
-        monster_name = random.choice(list(self.monsters.keys()))
-        monster = self.monsters[monster_name].copy()
-        
-        await interaction.response.defer()
-        
-        # Combat simulation
-        player_hp = player_data["hp"]
-        monster_hp = monster["hp"]
-        
-        # Calculate player stats with equipment
-        player_attack = player_data["attack"]
-        player_defense = player_data["defense"]
-        
-        if player_data["weapon"]:
-            weapon_info = self.equipment["weapons"][player_data["weapon"]]
-            player_attack += weapon_info["attack"]
-        
-        if player_data["armor"]:
-            armor_info = self.equipment["armor"][player_data["armor"]]
-            player_defense += armor_info["defense"]
-        
-        combat_log = []
-        turn = 1
-        
-        while player_hp > 0 and monster_hp > 0 and turn <= 10:
+            
+            # Check cooldown (Unix seconds; older saves stored an ISO string)
+            cooldown = player_data["quest_cooldown"]
+            if isinstance(cooldown, str):
+                cooldown = int(datetime.fromisoformat(cooldown).timestamp())
+                player_data["quest_cooldown"] = cooldown
+            now = int(time.time())
+            if cooldown and now < cooldown:
+                await interaction.response.send_message(f"⏰ Quest cooldown: {cooldown - now}s remaining", ephemeral=True)
+                return
+            
+            # Random monster encounter
+            monster_name = random.choice(self._monster_names)
+            monster = self.monsters[monster_name]
+            monster_hp, monster_attack, monster_defense, exp_gained, gold_gained = monster[:5]
+            
+            await interaction.response.defer()
+            
+            # Combat simulation
+            player_hp = player_data["hp"]
+            
+            # Calculate player stats with equipment
+            player_attack, player_defense = self._effective_stats(user_id, guild_id, player_data)
             # Player attacks first if speed is higher
-            if player_data["speed"] >= monster.get("speed", 10):
-                # Player attack
-                damage = max(1, player_attack - monster["defense"])
-                monster_hp -= damage
-                combat_log.append(f"⚔️ You deal {damage} damage! Monster HP: {max(0, monster_hp)}")
-                
-                if monster_hp <= 0:
-                    break
-                
-                # Monster attack
-                damage = max(1, monster["attack"] - player_defense)
-                player_hp -= damage
-                combat_log.append(f"👹 {monster_name.title()} deals {damage} damage! Your HP: {max(0, player_hp)}")
+            player_first = player_data["speed"] >= monster.speed
+            player_damage = max(1, player_attack - monster_defense)
+            monster_damage = max(1, monster_attack - player_defense)
+            
+            if player_first:
+                first = (player_hp, player_damage, monster_hp, monster_damage)
             else:
-                # Monster attacks first
-                damage = max(1, monster["attack"] - player_defense)
-                player_hp -= damage
-                combat_log.append(f"👹 {monster_name.title()} deals {damage} damage! Your HP: {max(0, player_hp)}")
-                
-                if player_hp <= 0:
-                    break
-                
-                # Player attack
-                damage = max(1, player_attack - monster["defense"])
-                monster_hp -= damage
-                combat_log.append(f"⚔️ You deal {damage} damage! Monster HP: {max(0, monster_hp)}")
+                first = (monster_hp, monster_damage, player_hp, player_damage)
+            first_hits, second_hits = resolve_combat(*first, max_turns=10)
             
-            turn += 1
-        
-        # Determine outcome
-        if player_hp <= 0:
-            # Player defeated
-            embed = discord.Embed(
-                title=f"💀 Quest Failed!",
-                description=f"You were defeated by the {monster_name.title()}!",
-                color=discord.Color.red()
-            )
-            player_data["hp"] = 1  # Don't let player die completely
-        else:
-            # Player won
-            exp_gained = monster["exp"]
-            gold_gained = monster["gold"]
-            
-            player_data["exp"] += exp_gained
-            player_data["gold"] += gold_gained
-            player_data["hp"] = player_hp
-            
-            # Level up check
-            level_up = False
-            while player_data["exp"] >= 100:
-                player_data["exp"] -= 100
-                player_data["level"] += 1
-                player_data["max_hp"] += 10
-                player_data["hp"] = player_data["max_hp"]  # Full heal on level up
-                player_data["attack"] += 2
-                player_data["defense"] += 1
-                level_up = True
+            if player_first:
+                player_hits, monster_hits = first_hits, second_hits
+            else:
+                player_hits, monster_hits = second_hits, first_hits
             
-            embed = discord.Embed(
-                title=f"🎉 Quest Complete!",
-                description=f"You defeated the {monster_name.title()}!",
-                color=discord.Color.green()
-            )
+            # Only the last 4 actions are shown; keep them as compact tuples until rendering
+            combat_log = [
+                (by_first == player_first, damage, hp_left)
+                for by_first, damage, hp_left in combat_events(*first, first_hits, second_hits, last=4)
+            ]
+            monster_title = self._monster_display[monster_name]
             
-            embed.add_field(
-                name="💰 Rewards",
-                value=f"**EXP:** +{exp_gained}\n**Gold:** +{gold_gained}",
-                inline=True
-            )
+            player_hp -= monster_hits * monster_damage
+            monster_hp -= player_hits * player_damage
+            
+            # Determine outcome
+            if player_hp <= 0:
+                # Player defeated
+                embed = discord.Embed(
+                    title=f"💀 Quest Failed!",
+                    description=f"You were defeated by the {monster_title}!",
+                    color=discord.Color.red()
+                )
+                player_data["hp"] = 1  # Don't let player die completely
+            else:
+                # Player won
+                player_data["exp"] += exp_gained
+                player_data["gold"] += gold_gained
+                player_data["hp"] = player_hp
+            
+                # Level up check
+                level_up = False
+                while player_data["exp"] >= 100:
+                    player_data["exp"] -= 100
+                    player_data["level"] += 1
+                    player_data["max_hp"] += 10
+                    player_data["hp"] = player_data["max_hp"]  # Full heal on level up
+                    player_data["attack"] += 2
+                    player_data["defense"] += 1
+                    level_up = True
+                if level_up:
+                    self._invalidate_stats(user_id, guild_id)
+            
+                embed = discord.Embed(
+                    title=f"🎉 Quest Complete!",
+                    description=f"You defeated the {monster_title}!",
+                    color=discord.Color.green()
+                )
             
-            if level_up:
                 embed.add_field(
-                    name="🎊 LEVEL UP!",
-                    value=f"Level {player_data['level']}!\n+10 HP, +2 ATK, +1 DEF",
+                    name="💰 Rewards",
+                    value=f"**EXP:** +{exp_gained}\n**Gold:** +{gold_gained}",
                     inline=True
                 )
-        
-        # Set cooldown (5 minutes)
-        player_data["quest_cooldown"] = (datetime.now() + timedelta(minutes=5)).isoformat()
-        
-        self._save_player_data(user_id, guild_id, player_data)
-        
-        # Add combat log
-        if len(combat_log) > 0:
-            embed.add_field(
-                name="⚔️ Combat Log",
-                value="\n".join(combat_log[-4:]),  # Show last 4 actions
-                inline=False
-            )
-        
-        await interaction.followup.send(embed=embed)
+            
+                if level_up:
+                    embed.add_field(
+                        name="🎊 LEVEL UP!",
+                        value=f"Level {player_data['level']}!\n+10 HP, +2 ATK, +1 DEF",
+                        inline=True
+                    )
+            
+            # Set cooldown (5 minutes)
+            player_data["quest_cooldown"] = now + 300
+            
+            self._mark_dirty(guild_id)
+            
+            # Add combat log
+            if combat_log:
+                embed.add_field(
+                    name="⚔️ Combat Log",
+                    value="\n".join(_format_combat_event(event, monster_title) for event in combat_log),
+                    inline=False
+                )
+            
+            await interaction.followup.send(embed=embed)
 
     @app_commands.command(name="rpg_shop", description="Buy weapons and armor to improve your character")
+    @app_commands.describe(item_type="Type of equipment to browse")
+    @app_commands.choices(item_type=[
+        app_commands.Choice(name="⚔️ Weapons", value="weapons"),
+        app_commands.Choice(name="🛡️ Armor", value="armor")
+    ])
     async def rpg_shop(self, interaction: discord.Interaction, item_type: str = "weapons"):
         """RPG shop for equipment"""
-        user_id = str(interaction.user.id)
-        guild_id = str(interaction.guild.id)
-        
-        player_data = self._get_player_data(user_id, guild_id)
+        user_id = interaction.user.id
+        guild_id = interaction.guild.id
         
-        if not player_data["character_class"]:
-            await interaction.response.send_message("❌ Start your adventure first with `/rpg_start`!", ephemeral=True)
-            return
+        player_data = self._get_player_or_none(user_id, guild_id)
         
-        if item_type.lower() not in ["weapons", "armor"]:
-            await interaction.response.send_message("❌ Choose 'weapons' or 'armor'", ephemeral=True)
+        if player_data is None:
+            await interaction.response.send_message(NO_CHAR_MSG, ephemeral=True)
             return
         
-        items = self.equipment[item_type.lower()]
-        
         embed = discord.Embed(
             title=f"🏪 RPG Shop - {item_type.title()}",
             description=f"Your Gold: {player_data['gold']:,}",
             color=discord.Color.orange()
         )
         
-        for item_name, item_info in items.items():
-            stat_name = "Attack" if item_type.lower() == "weapons" else "Defense"
-            stat_value = item_info.get("attack" if item_type.lower() == "weapons" else "defense", 0)
-            
-            embed.add_field(
-                name=f"{item_info['emoji']} {item_name.replace('_', ' ').title()}",
-                value=f"**{stat_name}:** +{stat_value}\n**Price:** {item_info['price']} gold",
-                inline=True
-            )
+        for field_name, field_value in self._shop_fields[item_type]:
+            embed.add_field(name=field_name, value=field_value, inline=True)
         
         embed.set_footer(text="Use /rpg_buy <item_name> to purchase")
         
@@ -433,68 +635,64 @@ class AdvancedGamesCog(commands.Cog):
     @app_commands.describe(item_name="Name of the item to buy")
     async def rpg_buy(self, interaction: discord.Interaction, item_name: str):
         """Buy an item from the shop"""
-        user_id = str(interaction.user.id)
-        guild_id = str(interaction.guild.id)
-        
-        player_data = self._get_player_data(user_id, guild_id)
-        
-        if not player_data["character_class"]:
-            await interaction.response.send_message("❌ Start your adventure first with `/rpg_start`!", ephemeral=True)
-            return
-        
-        item_name = item_name.lower().replace(" ", "_")
-        item_found = None
-        item_type = None
-        
-        # Find the item
-        for category, items in self.equipment.items():
-            if item_name in items:
-                item_found = items[item_name]
-                item_type = category
-                break
-        
-        if not item_found:
-            await interaction.response.send_message("❌ Item not found! Check `/rpg_shop` for available items.", ephemeral=True)
-            return
-        
-        if player_data["gold"] < item_found["price"]:
-            await interaction.response.send_message(f"❌ Not enough gold! You need {item_found['price']} gold.", ephemeral=True)
-            return
-        
-        # Purchase item
-        player_data["gold"] -= item_found["price"]
-        
-        if item_type == "weapons":
-            old_weapon = player_data["weapon"]
-            player_data["weapon"] = item_name
-        else:
-            old_armor = player_data["armor"]
-            player_data["armor"] = item_name
-        
-        self._save_player_data(user_id, guild_id, player_data)
-        
-        embed = discord.Embed(
-            title="✅ Purchase Successful!",
-            description=f"You bought **{item_name.replace('_', ' ').title()}**!",
-            color=discord.Color.green()
-        )
-        
-        embed.add_field(
-            name="💰 Cost",
-            value=f"{item_found['price']} gold\nRemaining: {player_data['gold']} gold",
-            inline=True
-        )
-        
-        stat_name = "Attack" if item_type == "weapons" else "Defense"
-        stat_value = item_found.get("attack" if item_type == "weapons" else "defense", 0)
-        
-        embed.add_field(
-            name="📈 Stats",
-            value=f"+{stat_value} {stat_name}",
-            inline=True
-        )
+        user_id = interaction.user.id
+        guild_id = interaction.guild.id
         
-        await interaction.response.send_message(embed=embed)
+        async with self._user_lock(user_id, guild_id):
+            player_data = self._get_player_or_none(user_id, guild_id)
+            
+            if player_data is None:
+                await interaction.response.send_message(NO_CHAR_MSG, ephemeral=True)
+                return
+            
+            item_name = item_name.lower().replace(" ", "_")
+            
+            # Find the item
+            entry = self.item_index.get(item_name)
+            if entry is None:
+                await interaction.response.send_message("❌ Item not found! Check `/rpg_shop` for available items.", ephemeral=True)
+                return
+            item_type, item_found = entry
+            
+            if player_data["gold"] < item_found.price:
+                await interaction.response.send_message(f"❌ Not enough gold! You need {item_found.price} gold.", ephemeral=True)
+                return
+            
+            # Purchase item
+            player_data["gold"] -= item_found.price
+            
+            if item_type == "weapons":
+                old_weapon = player_data["weapon"]
+                player_data["weapon"] = item_name
+            else:
+                old_armor = player_data["armor"]
+                player_data["armor"] = item_name
+            self._invalidate_stats(user_id, guild_id)
+            
+            self._save_player_data(user_id, guild_id, player_data)
+            
+            embed = discord.Embed(
+                title="✅ Purchase Successful!",
+                description=f"You bought **{self._item_display[item_name]}**!",
+                color=discord.Color.green()
+            )
+            
+            embed.add_field(
+                name="💰 Cost",
+                value=f"{item_found.price} gold\nRemaining: {player_data['gold']} gold",
+                inline=True
+            )
+            
+            stat_name = "Attack" if item_type == "weapons" else "Defense"
+            stat_value = item_found.attack if item_type == "weapons" else item_found.defense
+            
+            embed.add_field(
+                name="📈 Stats",
+                value=f"+{stat_value} {stat_name}",
+                inline=True
+            )
+            
+            await interaction.response.send_message(embed=embed)
 
     @app_commands.command(name="rpg_battle", description="Challenge another player to PvP combat")
     @app_commands.describe(opponent="Player to challenge")
@@ -508,14 +706,14 @@ class AdvancedGamesCog(commands.Cog):
             await interaction.response.send_message("❌ Can't battle yourself!", ephemeral=True)
             return
         
-        user_id = str(interaction.user.id)
-        opponent_id = str(opponent.id)
-        guild_id = str(interaction.guild.id)
+        user_id = interaction.user.id
+        opponent_id = opponent.id
+        guild_id = interaction.guild.id
         
-        player1_data = self._get_player_data(user_id, guild_id)
-        player2_data = self._get_player_data(opponent_id, guild_id)
+        player1_data = self._get_player_or_none(user_id, guild_id)
+        player2_data = self._get_player_or_none(opponent_id, guild_id)
         
-        if not player1_data["character_class"] or not player2_data["character_class"]:
+        if player1_data is None or player2_data is None:
             await interaction.response.send_message("❌ Both players need characters! Use `/rpg_start` first.", ephemeral=True)
             return
         
@@ -528,13 +726,13 @@ class AdvancedGamesCog(commands.Cog):
         
         embed.add_field(
             name=f"{interaction.user.display_name}",
-            value=f"Level {player1_data['level']} {player1_data['character_class'].title()}",
+            value=f"Level {player1_data['level']} {self._class_display[player1_data['character_class']]}",
             inline=True
         )
         
         embed.add_field(
             name=f"{opponent.display_name}",
-            value=f"Level {player2_data['level']} {player2_data['character_class'].title()}",
+            value=f"Level {player2_data['level']} {self._class_display[player2_data['character_class']]}",
             inline=True
         )
         
@@ -545,36 +743,21 @@ class AdvancedGamesCog(commands.Cog):
     @app_commands.command(name="rpg_leaderboard", description="View the RPG leaderboard")
     async def rpg_leaderboard(self, interaction: discord.Interaction, category: str = "level"):
         """View RPG leaderboard"""
-        guild_id = str(interaction.guild.id)
-        rpg_data = self._read_json(self.rpg_file)
+        if category not in LEADERBOARD_CATEGORIES:
+            await interaction.response.send_message("❌ Choose: level, gold, or pvp", ephemeral=True)
+            return
         
-        if guild_id not in rpg_data or not rpg_data[guild_id]:
+        guild_id = interaction.guild.id
+        if not self._rpg_cache.get(guild_id):
             await interaction.response.send_message("❌ No RPG data found!", ephemeral=True)
             return
         
-        players = []
-        for user_id, player_data in rpg_data[guild_id].items():
-            if player_data.get("character_class"):
-                user = self.bot.get_user(int(user_id))
-                if user:
-                    players.append((user, player_data))
-        
-        if category == "level":
-            players.sort(key=lambda x: x[1]["level"], reverse=True)
-            title = "🏆 Level Leaderboard"
-        elif category == "gold":
-            players.sort(key=lambda x: x[1]["gold"], reverse=True)
-            title = "💰 Gold Leaderboard"
-        elif category == "pvp":
-            players.sort(key=lambda x: x[1]["pvp_wins"], reverse=True)
-            title = "⚔️ PvP Wins Leaderboard"
-        else:
-            await interaction.response.send_message("❌ Choose: level, gold, or pvp", ephemeral=True)
-            return
+        players = self._get_leaderboard(guild_id, category)
+        title = LEADERBOARD_CATEGORIES[category][1]
         
         embed = discord.Embed(title=title, color=discord.Color.gold())
         
-        for i, (user, data) in enumerate(players[:10], 1):
+        for i, (user, data) in enumerate(players, 1):
             if category == "level":
                 value = f"Level {data['level']}"
             elif category == "gold":
@@ -606,58 +789,35 @@ class BattleView(discord.ui.View):
             await interaction.response.send_message("❌ Only the challenged player can accept!", ephemeral=True)
             return
         
+        if self.accepted:
+            await interaction.response.send_message("❌ This battle is already underway!", ephemeral=True)
+            return
         self.accepted = True
         
         # Simulate battle
         await interaction.response.defer()
         
-        # Calculate stats for both players
-        p1_attack = self.player1_data["attack"]
-        p1_defense = self.player1_data["defense"]
+        # Calculate stats for both players, including equipment bonuses
+        guild_id = interaction.guild.id
+        p1_attack, p1_defense = self.cog._effective_stats(self.challenger.id, guild_id, self.player1_data)
         p1_hp = self.player1_data["hp"]
         
-        p2_attack = self.player2_data["attack"]
-        p2_defense = self.player2_data["defense"]
+        p2_attack, p2_defense = self.cog._effective_stats(self.opponent.id, guild_id, self.player2_data)
         p2_hp = self.player2_data["hp"]
         
-        # Add equipment bonuses
-        if self.player1_data["weapon"]:
-            weapon_info = self.cog.equipment["weapons"][self.player1_data["weapon"]]
-            p1_attack += weapon_info["attack"]
-        if self.player1_data["armor"]:
-            armor_info = self.cog.equipment["armor"][self.player1_data["armor"]]
-            p1_defense += armor_info["defense"]
-            
-        if self.player2_data["weapon"]:
-            weapon_info = self.cog.equipment["weapons"][self.player2_data["weapon"]]
-            p2_attack += weapon_info["attack"]
-        if self.player2_data["armor"]:
-            armor_info = self.cog.equipment["armor"][self.player2_data["armor"]]
-            p2_defense += armor_info["defense"]
+        p1_damage = max(1, p1_attack - p2_defense)
+        p2_damage = max(1, p2_attack - p1_defense)
         
         # Battle simulation
-        turn = 1
-        while p1_hp > 0 and p2_hp > 0 and turn <= 20:
-            if self.player1_data["speed"] >= self.player2_data["speed"]:
-                # Player 1 attacks first
-                damage = max(1, p1_attack - p2_defense)
-                p2_hp -= damage
-                if p2_hp <= 0:
-                    break
-                
-                damage = max(1, p2_attack - p1_defense)
-                p1_hp -= damage
-            else:
-                # Player 2 attacks first
-                damage = max(1, p2_attack - p1_defense)
-                p1_hp -= damage
-                if p1_hp <= 0:
-                    break
-                
-                damage = max(1, p1_attack - p2_defense)
-                p2_hp -= damage
-            
-            turn += 1
+        if self.player1_data["speed"] >= self.player2_data["speed"]:
+            # Player 1 attacks first
+            p1_hits, p2_hits = resolve_combat(p1_hp, p1_damage, p2_hp, p2_damage, max_turns=20)
+        else:
+            # Player 2 attacks first
+            p2_hits, p1_hits = resolve_combat(p2_hp, p2_damage, p1_hp, p1_damage, max_turns=20)
+        
+        p1_hp -= p2_hits * p2_damage
+        p2_hp -= p1_hits * p1_damage
         
         # Determine winner
         if p1_hp > p2_hp:
@@ -675,10 +835,8 @@ class BattleView(discord.ui.View):
         winner_data["pvp_wins"] += 1
         loser_data["pvp_losses"] += 1
         
-        # Save data
-        guild_id = str(interaction.guild.id)
-        self.cog._save_player_data(str(winner.id), guild_id, winner_data)
-        self.cog._save_player_data(str(loser.id), guild_id, loser_data)
+        # Both players are live cache entries, so one dirty mark saves them
+        self.cog._mark_dirty(interaction.guild.id)
         
         # Create result embed
         embed = discord.Embed(
@@ -4,14 +4,58 @@ from discord import app_commands
 import asyncio
 import random
 import logging
+from functools import cached_property, wraps
 from bot.utils.helpers import create_embed
 
 logger = logging.getLogger(__name__)
 
+ANIMATION_NAMES = {
+    'search': '🔍 Search Animation',
+    'loading': '⏳ Loading Animation',
+    'celebration': '🎉 Celebration Animation',
+    'music': '🎵 Music Animation',
+    'books': '📚 Books Animation',
+    'manga': '📖 Manga Animation',
+    'gaming': '🎮 Gaming Animation',
+    'idle': '😴 Idle Animation'
+}
+
+ANIMATION_TYPES_TEXT = (
+    "• **Musical**: 🎵 🎶 🎼 🎹 🎸 🥁\n"
+    "• **Books**: 📚 📖 📝 📄 📜 📋\n"
+    "• **Search**: 🔍 🔎 🕵️ 🔬 📡 ⚡\n"
+    "• **Loading**: ⚪ 🔵 🔴 🟡 🟢 🟣\n"
+    "• **Spinning**: ◐ ◓ ◑ ◒\n"
+    "• **Pulsing**: 🔆 🔅 💫 ⭐ ✨ 🌟"
+)
+
+DEMO_SEQUENCE = ('search', 'loading', 'music', 'books', 'manga', 'gaming', 'celebration')
+DEMO_MIN_STEP_SECONDS = 5
+
+def require_status_manager(defer=False, ephemeral=True):
+    """Reject the command when the status system isn't running, optionally deferring first"""
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(self, interaction: discord.Interaction, *args, **kwargs):
+            if getattr(self.bot, 'status_manager', None) is None:
+                await interaction.response.send_message("❌ Animated status system not available", ephemeral=True)
+                return
+            if defer:
+                await interaction.response.defer(ephemeral=ephemeral)
+            return await func(self, interaction, *args, **kwargs)
+        return wrapper
+    return decorator
+
 class AnimatedCommandsCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         
+    @cached_property
+    def _sequences_text(self) -> str:
+        """Available sequences field for status_info, built on first use"""
+        sequences = list(self.bot.status_manager.status_sequences.keys())
+        return f"**{len(sequences)} sequences:**\n" + ", ".join(sequences)
+        
     @app_commands.command(name="animate", description="Trigger specific animation sequences")
     @app_commands.describe(
         animation="Choose an animation type",
@@ -27,47 +71,30 @@ class AnimatedCommandsCog(commands.Cog):
         app_commands.Choice(name="🎮 Gaming", value="gaming"),
         app_commands.Choice(name="😴 Idle", value="idle"),
     ])
+    @require_status_manager(defer=True)
     async def animate_status(self, interaction: discord.Interaction, animation: str, duration: int = 10):
         """Trigger specific animation sequences"""
-        if not hasattr(self.bot, 'status_manager') or not self.bot.status_manager:
-            await interaction.response.send_message("❌ Animated status system not available", ephemeral=True)
-            return
-        
         # Validate duration
         if duration < 5 or duration > 300:
-            await interaction.response.send_message("❌ Duration must be between 5 and 300 seconds", ephemeral=True)
+            await interaction.followup.send("❌ Duration must be between 5 and 300 seconds", ephemeral=True)
             return
         
         # Trigger the animation
         await self.bot.status_manager.set_sequence(animation, duration)
         
         # Create response embed
-        animation_names = {
-            'search': '🔍 Search Animation',
-            'loading': '⏳ Loading Animation',
-            'celebration': '🎉 Celebration Animation',
-            'music': '🎵 Music Animation',
-            'books': '📚 Books Animation',
-            'manga': '📖 Manga Animation',
-            'gaming': '🎮 Gaming Animation',
-            'idle': '😴 Idle Animation'
-        }
-        
         embed = create_embed(
-            f"✨ {animation_names.get(animation, 'Animation')} Started",
+            f"✨ {ANIMATION_NAMES.get(animation, 'Animation')} Started",
             f"Running for {duration} seconds, then returning to default rotation",
             discord.Color.blue()
         )
         
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await interaction.followup.send(embed=embed, ephemeral=True)
         
     @app_commands.command(name="status_info", description="View detailed status system information")
+    @require_status_manager(defer=True, ephemeral=False)
     async def status_info(self, interaction: discord.Interaction):
         """View detailed status system information"""
-        if not hasattr(self.bot, 'status_manager') or not self.bot.status_manager:
-            await interaction.response.send_message("❌ Animated status system not available", ephemeral=True)
-            return
-        
         status_mgr = self.bot.status_manager
         
         embed = create_embed(
@@ -79,29 +106,28 @@ class AnimatedCommandsCog(commands.Cog):
         # Current sequence info
         embed.add_field(
             name="🔄 Current Sequence",
-            value=f"**{status_mgr.current_sequence.title()}**\nStep {status_mgr.current_status_index + 1} of {len(status_mgr.status_sequences[status_mgr.current_sequence])}",
+            value=f"**{status_mgr.current_sequence.title()}**\nStep {status_mgr.current_status_index + 1} of {len(status_mgr.status_sequences[status_mgr.current_sequence][0])}",
             inline=True
         )
         
         # Animation speed
         embed.add_field(
             name="⏱️ Animation Speed",
-            value=f"{status_mgr.animation_speed} seconds per status",
+            value=f"{status_mgr.status_updater.seconds} seconds per status",
             inline=True
         )
         
         # System status
         embed.add_field(
             name="🟢 System Status",
-            value="Running" if status_mgr.is_running else "Stopped",
+            value="Running" if status_mgr.status_updater.is_running() else "Stopped",
             inline=True
         )
         
         # Available sequences
-        sequences = list(status_mgr.status_sequences.keys())
         embed.add_field(
             name="🎬 Available Sequences",
-            value=f"**{len(sequences)} sequences:**\n" + ", ".join(sequences),
+            value=self._sequences_text,
             inline=False
         )
         
@@ -116,11 +142,11 @@ class AnimatedCommandsCog(commands.Cog):
         # Animation types
         embed.add_field(
             name="✨ Animation Types",
-            value="• **Musical**: 🎵 🎶 🎼 🎹 🎸 🥁\n• **Books**: 📚 📖 📝 📄 📜 📋\n• **Search**: 🔍 🔎 🕵️ 🔬 📡 ⚡\n• **Loading**: ⚪ 🔵 🔴 🟡 🟢 🟣\n• **Spinning**: ◐ ◓ ◑ ◒\n• **Pulsing**: 🔆 🔅 💫 ⭐ ✨ 🌟",
+            value=ANIMATION_TYPES_TEXT,
             inline=False
         )
         
-        await interaction.response.send_message(embed=embed)
+        await interaction.followup.send(embed=embed)
     
     @app_commands.command(name="status_control", description="Control the animated status system")
     @app_commands.describe(action="Action to perform")
@@ -131,12 +157,9 @@ class AnimatedCommandsCog(commands.Cog):
         app_commands.Choice(name="🏠 Reset to Default", value="reset")
     ])
     @app_commands.default_permissions(administrator=True)
+    @require_status_manager(defer=True)
     async def status_control(self, interaction: discord.Interaction, action: str):
         """Control the animated status system (Admin only)"""
-        if not hasattr(self.bot, 'status_manager') or not self.bot.status_manager:
-            await interaction.response.send_message("❌ Animated status system not available", ephemeral=True)
-            return
-        
         status_mgr = self.bot.status_manager
         
         try:
@@ -169,29 +192,32 @@ class AnimatedCommandsCog(commands.Cog):
                 color
             )
             
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.followup.send(embed=embed, ephemeral=True)
             
         except Exception as e:
             logger.error(f"Error controlling status system: {e}")
-            await interaction.response.send_message("❌ Error controlling status system", ephemeral=True)
+            await interaction.followup.send("❌ Error controlling status system", ephemeral=True)
     
     @app_commands.command(name="demo_animations", description="Demonstrate all animation types")
+    @require_status_manager(defer=True, ephemeral=False)
     async def demo_animations(self, interaction: discord.Interaction):
         """Demonstrate all animation types"""
-        if not hasattr(self.bot, 'status_manager') or not self.bot.status_manager:
-            await interaction.response.send_message("❌ Animated status system not available", ephemeral=True)
-            return
-        
-        await interaction.response.defer()
-        
         status_mgr = self.bot.status_manager
         
         # Demo sequence
-        demo_sequence = ['search', 'loading', 'music', 'books', 'manga', 'gaming', 'celebration']
+        demo_sequence = DEMO_SEQUENCE
+        
+        # Each step has to outlast a status tick, or its animation never reaches the presence
+        intervals = status_mgr.config.intervals
+        step_seconds = max(
+            DEMO_MIN_STEP_SECONDS,
+            status_mgr.status_updater.seconds,
+            *(intervals.get(animation, status_mgr.animation_speed) for animation in demo_sequence)
+        )
         
         embed = create_embed(
             "🎬 Animation Demo Started",
-            f"Demonstrating {len(demo_sequence)} animation types (5 seconds each)",
+            f"Demonstrating {len(demo_sequence)} animation types ({step_seconds:g} seconds each)",
             discord.Color.blue()
         )
         
@@ -205,7 +231,7 @@ class AnimatedCommandsCog(commands.Cog):
         
         # Run demo
         for i, animation in enumerate(demo_sequence):
-            await status_mgr.set_sequence(animation, 5)
+            status_mgr.set_sequence_now(animation)
             
             # Update progress
             progress_embed = create_embed(
@@ -219,11 +245,10 @@ class AnimatedCommandsCog(commands.Cog):
             except:
                 pass
             
-            await asyncio.sleep(5)
+            await asyncio.sleep(step_seconds)
         
         # Reset to default
-        status_mgr.current_sequence = 'default'
-        status_mgr.current_status_index = 0
+        status_mgr.set_sequence_now('default')
         
         final_embed = create_embed(
             "✅ Demo Complete",
@@ -1,202 +1,432 @@
 import asyncio
+import aiohttp
 import discord
 from discord.ext import tasks
 import random
 import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from itertools import cycle
+from types import MappingProxyType
+from typing import Mapping, NamedTuple, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Discord allows 5 presence updates per 60 seconds per session
+PRESENCE_RATE_LIMIT = 5
+PRESENCE_RATE_WINDOW = 60.0
+
+# Seconds of quiet after a guild join/leave before recounting
+COUNT_REFRESH_DELAY = 15.0
+
+class _Status(NamedTuple):
+    """One frame of a status sequence"""
+    name: str
+    type: discord.ActivityType
+
+# Animated status sequences as (name, activity type) frames
+_STATUS_SEQUENCES = {
+    'default': (
+        _Status("🔍 Looking up songs", discord.ActivityType.watching),
+        _Status("📚 Searching books", discord.ActivityType.watching),
+        _Status("📖 Finding manga", discord.ActivityType.watching),
+        _Status("🎵 Music discovery", discord.ActivityType.listening),
+        _Status("💬 {guilds} servers", discord.ActivityType.watching),
+        _Status("🎮 Gaming stats", discord.ActivityType.watching),
+        _Status("🤖 {users:,} users", discord.ActivityType.playing),
+        _Status("📊 Analytics", discord.ActivityType.watching),
+    ),
+    'search': (
+        _Status("🔍 Searching...", discord.ActivityType.playing),
+        _Status("📡 Fetching data...", discord.ActivityType.playing),
+        _Status("⚡ Processing...", discord.ActivityType.playing),
+        _Status("✅ Results ready!", discord.ActivityType.watching),
+    ),
+    'loading': (
+        _Status("⏳ Loading", discord.ActivityType.playing),
+        _Status("⏳ Loading.", discord.ActivityType.playing),
+        _Status("⏳ Loading..", discord.ActivityType.playing),
+        _Status("⏳ Loading...", discord.ActivityType.playing),
+    ),
+    'music': (
+        _Status("🎵 Song lookup active", discord.ActivityType.listening),
+        _Status("🎶 Music discovery", discord.ActivityType.listening),
+        _Status("🎸 Artist information", discord.ActivityType.listening),
+        _Status("💿 Album details", discord.ActivityType.listening),
+    ),
+    'books': (
+        _Status("📚 Book searching", discord.ActivityType.watching),
+        _Status("📖 Reading database", discord.ActivityType.watching),
+        _Status("📝 Author lookup", discord.ActivityType.watching),
+        _Status("🏛️ Library access", discord.ActivityType.watching),
+    ),
+    'manga': (
+        _Status("📖 Manga search", discord.ActivityType.watching),
+        _Status("🇯🇵 Anime database", discord.ActivityType.watching),
+        _Status("👑 Top manga", discord.ActivityType.watching),
+        _Status("✨ New chapters", discord.ActivityType.watching),
+    ),
+    'gaming': (
+        _Status("🎮 Gaming stats", discord.ActivityType.playing),
+        _Status("🏆 RPG adventures", discord.ActivityType.playing),
+        _Status("⚔️ Battle system", discord.ActivityType.competing),
+        _Status("🎯 Achievements", discord.ActivityType.playing),
+    ),
+    'idle': (
+        _Status("😴 Resting...", discord.ActivityType.watching),
+        _Status("🌙 Night mode", discord.ActivityType.watching),
+        _Status("💤 Sleeping", discord.ActivityType.watching),
+        _Status("🔋 Charging", discord.ActivityType.watching),
+    ),
+    'celebration': (
+        _Status("🎉 Celebrating!", discord.ActivityType.playing),
+        _Status("✨ Success!", discord.ActivityType.playing),
+        _Status("🌟 Amazing!", discord.ActivityType.playing),
+        _Status("🎊 Party time!", discord.ActivityType.playing),
+    )
+}
+
+# Seconds per frame for sequences that shouldn't use the base animation speed
+_SEQUENCE_INTERVALS = MappingProxyType({
+    'default': 15.0,
+    'idle': 30.0
+})
+
+# Emoji frames for embed titles and loading indicators
+# Emoji shared between several pools, defined once so every table holds the same object
+_EMOJI_SPARKLES = '✨'
+_EMOJI_GLOWING_STAR = '🌟'
+_EMOJI_BOLT = '⚡'
+_EMOJI_OPEN_BOOK = '📖'
+
+_EMOJI_ANIMATIONS = MappingProxyType({
+    'loading_dots': ('⚪', '🔵', '🔴', '🟡', '🟢', '🟣'),
+    'spinning': ('◐', '◓', '◑', '◒'),
+    'bouncing': ('⬆️', '↗️', '➡️', '↘️', '⬇️', '↙️', '⬅️', '↖️'),
+    'pulsing': ('🔆', '🔅', '💫', '⭐', _EMOJI_SPARKLES, _EMOJI_GLOWING_STAR),
+    'musical': ('🎵', '🎶', '🎼', '🎹', '🎸', '🥁'),
+    'books': ('📚', _EMOJI_OPEN_BOOK, '📝', '📄', '📜', '📋'),
+    'search': ('🔍', '🔎', '🕵️', '🔬', '📡', _EMOJI_BOLT)
+})
+
+# Activity type -> emoji pool for get_activity_emoji
+_ACTIVITY_POOLS = MappingProxyType({
+    'song': _EMOJI_ANIMATIONS['musical'],
+    'book': _EMOJI_ANIMATIONS['books'],
+    'manga': (_EMOJI_OPEN_BOOK, '🇯🇵', '👑', _EMOJI_SPARKLES),
+    'comic': ('🦸', '💥', '🔥', _EMOJI_BOLT),
+    'search': _EMOJI_ANIMATIONS['search'],
+    'gaming': ('🎮', '🏆', '⚔️', '🎯'),
+    'celebration': ('🎉', _EMOJI_SPARKLES, _EMOJI_GLOWING_STAR, '🎊')
+})
+
+# Names rendered with live server/user counts at tick time
+_DYNAMIC_NAMES = frozenset({"💬 {guilds} servers", "🤖 {users:,} users"})
+
+@dataclass(frozen=True, slots=True)
+class StatusConfig:
+    """Read-only status tables shared by every manager"""
+    sequences: Mapping[str, Tuple[Tuple[str, ...], Tuple[discord.ActivityType, ...]]]
+    activities: Mapping[str, Tuple[Optional[discord.Activity], ...]]
+    emoji: Mapping[str, Tuple[str, ...]]
+    intervals: Mapping[str, float]
+
+def _build_config() -> StatusConfig:
+    """Build the status tables once at import"""
+    # Sequence -> (names, types) parallel tuples
+    sequences = {
+        sequence: tuple(zip(*frames))
+        for sequence, frames in _STATUS_SEQUENCES.items()
+    }
+    
+    # Prebuilt activities per frame; None marks frames rendered per tick
+    activities = {
+        sequence: tuple(
+            None if name in _DYNAMIC_NAMES else discord.Activity(type=activity_type, name=name)
+            for name, activity_type in zip(names, types)
+        )
+        for sequence, (names, types) in sequences.items()
+    }
+    
+    return StatusConfig(
+        sequences=MappingProxyType(sequences),
+        activities=MappingProxyType(activities),
+        emoji=_EMOJI_ANIMATIONS,
+        intervals=_SEQUENCE_INTERVALS
+    )
+
+_CONFIG = _build_config()
+
 class AnimatedStatusManager:
+    # Shortcuts into the shared config for callers outside the manager
+    status_sequences = _CONFIG.sequences
+    emoji_animations = _CONFIG.emoji
+    
+    # Activity type -> emoji pool for get_activity_emoji
+    activity_emoji_pools = _ACTIVITY_POOLS
+    
+    # Feature name -> status sequence
+    feature_sequences = MappingProxyType({
+        'music': 'music',
+        'song': 'music',
+        'book': 'books',
+        'manga': 'manga',
+        'comic': 'manga',
+        'gaming': 'gaming',
+        'rpg': 'gaming',
+        'search': 'search'
+    })
+    
     def __init__(self, bot):
         self.bot = bot
+        self.config = _CONFIG
         self.current_status_index = 0
-        self.is_running = False
         
-        # Define animated status sequences
-        self.status_sequences = {
-            'default': [
-                {"name": "🔍 Looking up songs", "type": discord.ActivityType.watching},
-                {"name": "📚 Searching books", "type": discord.ActivityType.watching},
-                {"name": "📖 Finding manga", "type": discord.ActivityType.watching},
-                {"name": "🎵 Music discovery", "type": discord.ActivityType.listening},
-                {"name": "💬 Server activity", "type": discord.ActivityType.watching},
-                {"name": "🎮 Gaming stats", "type": discord.ActivityType.watching},
-                {"name": "🤖 AI assistance", "type": discord.ActivityType.playing},
-                {"name": "📊 Analytics", "type": discord.ActivityType.watching},
-            ],
-            'search': [
-                {"name": "🔍 Searching...", "type": discord.ActivityType.playing},
-                {"name": "📡 Fetching data...", "type": discord.ActivityType.playing},
-                {"name": "⚡ Processing...", "type": discord.ActivityType.playing},
-                {"name": "✅ Results ready!", "type": discord.ActivityType.watching},
-            ],
-            'loading': [
-                {"name": "⏳ Loading", "type": discord.ActivityType.playing},
-                {"name": "⏳ Loading.", "type": discord.ActivityType.playing},
-                {"name": "⏳ Loading..", "type": discord.ActivityType.playing},
-                {"name": "⏳ Loading...", "type": discord.ActivityType.playing},
-            ],
-            'music': [
-                {"name": "🎵 Song lookup active", "type": discord.ActivityType.listening},
-                {"name": "🎶 Music discovery", "type": discord.ActivityType.listening},
-                {"name": "🎸 Artist information", "type": discord.ActivityType.listening},
-                {"name": "💿 Album details", "type": discord.ActivityType.listening},
-            ],
-            'books': [
-                {"name": "📚 Book searching", "type": discord.ActivityType.watching},
-                {"name": "📖 Reading database", "type": discord.ActivityType.watching},
-                {"name": "📝 Author lookup", "type": discord.ActivityType.watching},
-                {"name": "🏛️ Library access", "type": discord.ActivityType.watching},
-            ],
-            'manga': [
-                {"name": "📖 Manga search", "type": discord.ActivityType.watching},
-                {"name": "🇯🇵 Anime database", "type": discord.ActivityType.watching},
-                {"name": "👑 Top manga", "type": discord.ActivityType.watching},
-                {"name": "✨ New chapters", "type": discord.ActivityType.watching},
-            ],
-            'gaming': [
-                {"name": "🎮 Gaming stats", "type": discord.ActivityType.playing},
-                {"name": "🏆 RPG adventures", "type": discord.ActivityType.playing},
-                {"name": "⚔️ Battle system", "type": discord.ActivityType.competing},
-                {"name": "🎯 Achievements", "type": discord.ActivityType.playing},
-            ],
-            'idle': [
-                {"name": "😴 Resting...", "type": discord.ActivityType.watching},
-                {"name": "🌙 Night mode", "type": discord.ActivityType.watching},
-                {"name": "💤 Sleeping", "type": discord.ActivityType.watching},
-                {"name": "🔋 Charging", "type": discord.ActivityType.watching},
-            ],
-            'celebration': [
-                {"name": "🎉 Celebrating!", "type": discord.ActivityType.playing},
-                {"name": "✨ Success!", "type": discord.ActivityType.playing},
-                {"name": "🌟 Amazing!", "type": discord.ActivityType.playing},
-                {"name": "🎊 Party time!", "type": discord.ActivityType.playing},
-            ]
-        }
+        self.current_sequence = 'default'
+        self.animation_speed = 12.0  # seconds between status changes
+        
+        # Pending "back to default" task from a timed set_sequence
+        self._revert_task = None
         
-        # Special emoji animations
-        self.emoji_animations = {
-            'loading_dots': ['⚪', '🔵', '🔴', '🟡', '🟢', '🟣'],
-            'spinning': ['◐', '◓', '◑', '◒'],
-            'bouncing': ['⬆️', '↗️', '➡️', '↘️', '⬇️', '↙️', '⬅️', '↖️'],
-            'pulsing': ['🔆', '🔅', '💫', '⭐', '✨', '🌟'],
-            'musical': ['🎵', '🎶', '🎼', '🎹', '🎸', '🥁'],
-            'books': ['📚', '📖', '📝', '📄', '📜', '📋'],
-            'search': ['🔍', '🔎', '🕵️', '🔬', '📡', '⚡']
+        # Temporary (activity, expires_at monotonic) shown over the rotation
+        self._overlay = None
+        
+        # Pre-shuffled endless rotations so emoji picks stay varied without per-call RNG
+        self._rng = random.Random()
+        self._title_cycles = {
+            name: cycle(self._rng.sample(pool, len(pool)))
+            for name, pool in self.config.emoji.items()
+        }
+        self._activity_cycles = {
+            name: cycle(self._rng.sample(pool, len(pool)))
+            for name, pool in self.activity_emoji_pools.items()
         }
         
-        self.current_sequence = 'default'
-        self.animation_speed = 3.0  # seconds between status changes
+        # (sequence, index) -> (counts, activity) for the last rendered count-based frames
+        self._dynamic_activities = {}
+        
+        # Last (type, name) sent to the gateway, to skip identical updates
+        self._last_presence = None
+        
+        # Monotonic times of recent presence updates, for the rate limit window
+        self._recent_presences = deque(maxlen=PRESENCE_RATE_LIMIT)
+        
+        # Cached totals for the dynamic default statuses, kept current by listeners
+        self._guild_count = 0
+        self._user_count = 0
+        self._pending_refresh = None  # debounced recount after guild joins/leaves
+        bot.add_listener(self._on_guild_change, 'on_guild_join')
+        bot.add_listener(self._on_guild_change, 'on_guild_remove')
+        bot.add_listener(self._on_member_join, 'on_member_join')
+        bot.add_listener(self._on_member_remove, 'on_member_remove')
+    
+    def refresh_counts(self):
+        """Recompute the cached guild and user totals"""
+        guilds = self.bot.guilds
+        self._guild_count = len(guilds)
+        # member_count is None until a guild's member info has arrived
+        self._user_count = sum(guild.member_count or 0 for guild in guilds)
+    
+    def request_count_refresh(self):
+        """Recount once a burst of guild joins/leaves has settled"""
+        if self._pending_refresh is not None:
+            self._pending_refresh.cancel()
+        self._pending_refresh = asyncio.get_running_loop().call_later(
+            COUNT_REFRESH_DELAY, self._run_pending_refresh
+        )
+    
+    def _run_pending_refresh(self):
+        self._pending_refresh = None
+        self.refresh_counts()
+    
+    async def _on_guild_change(self, guild):
+        self.request_count_refresh()
+    
+    async def _on_member_join(self, member):
+        self._user_count += 1
+    
+    async def _on_member_remove(self, member):
+        self._user_count = max(0, self._user_count - 1)
         
     async def start_animated_status(self):
         """Start the animated status system"""
-        if not self.is_running:
-            self.is_running = True
+        if not self.status_updater.is_running():
+            self.refresh_counts()
+            # Presence may have been changed elsewhere while stopped; always send the first frame
+            self._last_presence = None
             self.status_updater.start()
+            if not self._count_refresher.is_running():
+                self._count_refresher.start()
             logger.info("Animated status system started")
     
     async def stop_animated_status(self):
         """Stop the animated status system"""
-        if self.is_running:
-            self.is_running = False
-            self.status_updater.stop()
+        if self.status_updater.is_running():
+            self.status_updater.cancel()
+            self._count_refresher.cancel()
+            if self._revert_task and not self._revert_task.done():
+                self._revert_task.cancel()
+            self._revert_task = None
             logger.info("Animated status system stopped")
     
+    def set_sequence_now(self, sequence_name: str) -> bool:
+        """Switch to a status sequence immediately"""
+        if sequence_name not in self.status_sequences:
+            return False
+        
+        # A newer switch supersedes any pending revert
+        if self._revert_task and not self._revert_task.done():
+            self._revert_task.cancel()
+        self._revert_task = None
+        
+        self.current_sequence = sequence_name
+        self.current_status_index = 0
+        logger.info(f"Status sequence changed to: {sequence_name}")
+        return True
+    
+    async def _revert_after(self, duration: int):
+        """Return to the default sequence after a delay"""
+        await asyncio.sleep(duration)
+        self.current_sequence = 'default'
+        self.current_status_index = 0
+    
     async def set_sequence(self, sequence_name: str, duration: int = None):
         """Set a specific status sequence"""
-        if sequence_name in self.status_sequences:
-            self.current_sequence = sequence_name
-            self.current_status_index = 0
-            logger.info(f"Status sequence changed to: {sequence_name}")
-            
-            # If duration is specified, revert to default after that time
-            if duration:
-                await asyncio.sleep(duration)
-                self.current_sequence = 'default'
-                self.current_status_index = 0
+        if self.set_sequence_now(sequence_name) and duration:
+            # Revert to default in the background so the caller isn't held up
+            self._revert_task = asyncio.create_task(self._revert_after(duration))
     
     async def set_temporary_status(self, activity_name: str, activity_type: discord.ActivityType, duration: int = 5):
         """Set a temporary status that reverts after duration"""
-        # Store current state
-        original_sequence = self.current_sequence
-        original_index = self.current_status_index
-        
-        # Set temporary status
-        await self.bot.change_presence(
-            activity=discord.Activity(type=activity_type, name=activity_name)
+        # The updater shows this until it expires, then resumes the rotation where it left off
+        self._overlay = (
+            discord.Activity(type=activity_type, name=activity_name),
+            time.monotonic() + duration
         )
-        
-        # Wait for duration
-        await asyncio.sleep(duration)
-        
-        # Restore original state
-        self.current_sequence = original_sequence
-        self.current_status_index = original_index
     
-    async def create_animated_embed_title(self, base_title: str, animation_type: str = 'pulsing'):
+    def create_animated_embed_title(self, base_title: str, animation_type: str = 'pulsing'):
         """Create an animated title for embeds"""
-        if animation_type in self.emoji_animations:
-            emoji = random.choice(self.emoji_animations[animation_type])
-            return f"{emoji} {base_title}"
+        emojis = self._title_cycles.get(animation_type)
+        if emojis is not None:
+            return f"{next(emojis)} {base_title}"
         return base_title
     
-    async def get_loading_indicator(self, step: int = 0):
+    def get_loading_indicator(self, step: int = 0):
         """Get a loading indicator emoji"""
-        loading_emojis = self.emoji_animations['loading_dots']
+        loading_emojis = self.config.emoji['loading_dots']
         return loading_emojis[step % len(loading_emojis)]
     
-    async def get_activity_emoji(self, activity_type: str):
+    def get_activity_emoji(self, activity_type: str):
         """Get an appropriate emoji for activity type"""
-        emoji_map = {
-            'song': random.choice(self.emoji_animations['musical']),
-            'book': random.choice(self.emoji_animations['books']),
-            'manga': random.choice(['📖', '🇯🇵', '👑', '✨']),
-            'comic': random.choice(['🦸', '💥', '🔥', '⚡']),
-            'search': random.choice(self.emoji_animations['search']),
-            'gaming': random.choice(['🎮', '🏆', '⚔️', '🎯']),
-            'celebration': random.choice(['🎉', '✨', '🌟', '🎊'])
-        }
-        return emoji_map.get(activity_type, '🤖')
+        emojis = self._activity_cycles.get(activity_type)
+        if emojis is None:
+            return '🤖'
+        return next(emojis)
     
-    @tasks.loop(seconds=3.0)
+    @tasks.loop(seconds=12.0)
     async def status_updater(self):
         """Update bot status with animation"""
-        if not self.is_running:
+        if not self.bot.is_ready():
+            return
+        
+        # Out of presence budget: hold the current frame until the window frees up.
+        # Presence goes over the gateway, which reports no 429s, so this is the only limiter.
+        recent = self._recent_presences
+        if len(recent) == PRESENCE_RATE_LIMIT and time.monotonic() - recent[0] < PRESENCE_RATE_WINDOW:
             return
             
         try:
-            sequence = self.status_sequences[self.current_sequence]
-            status_info = sequence[self.current_status_index]
+            # A live temporary status holds the rotation in place
+            if self._overlay is not None:
+                activity, expires_at = self._overlay
+                if time.monotonic() < expires_at:
+                    presence = (activity.type, activity.name)
+                    if presence != self._last_presence and await self._change_presence(activity):
+                        self._last_presence = presence
+                    return
+                self._overlay = None
+            
+            activities = self.config.activities.get(self.current_sequence)
+            if activities is None:
+                # Reset once instead of failing every tick on a bad name
+                logger.warning(f"Unknown status sequence {self.current_sequence!r}, falling back to default")
+                self.current_sequence = 'default'
+                self.current_status_index = 0
+                activities = self.config.activities['default']
             
-            # Add random variation to some statuses
-            if self.current_sequence == 'default':
-                # Add server count to some statuses
-                if 'Server activity' in status_info['name']:
-                    guild_count = len(self.bot.guilds)
-                    status_info['name'] = f"💬 {guild_count} servers"
-                elif 'AI assistance' in status_info['name']:
-                    user_count = sum(guild.member_count for guild in self.bot.guilds)
-                    status_info['name'] = f"🤖 {user_count:,} users"
+            index = self.current_status_index
+            activity = activities[index]
             
-            # Apply status
-            await self.bot.change_presence(
-                activity=discord.Activity(
-                    type=status_info['type'],
-                    name=status_info['name']
-                )
-            )
+            # Fill in server/user counts, rebuilding only when they've changed
+            if activity is None:
+                activity = self._render_dynamic(self.current_sequence, index)
             
             # Move to next status
-            self.current_status_index = (self.current_status_index + 1) % len(sequence)
+            self.current_status_index = (index + 1) % len(activities)
+            
+            # Skip the gateway update if nothing visible changed
+            presence = (activity.type, activity.name)
+            if presence == self._last_presence:
+                return
+            
+            # Apply status
+            if await self._change_presence(activity):
+                self._last_presence = presence
             
-        except Exception as e:
-            logger.error(f"Error updating status: {e}")
+        except (discord.HTTPException, discord.ConnectionClosed, aiohttp.ClientError) as e:
+            # Transient gateway/HTTP trouble: try again next tick
+            logger.warning(f"Error updating status: {e}")
+        
+        finally:
+            self._sync_interval()
+    
+    def _render_dynamic(self, sequence: str, index: int) -> discord.Activity:
+        """Build the activity for a count-based frame, reusing it while the counts are unchanged"""
+        counts = (self._guild_count, self._user_count)
+        cached = self._dynamic_activities.get((sequence, index))
+        if cached is not None and cached[0] == counts:
+            return cached[1]
+        
+        names, types = self.config.sequences[sequence]
+        activity = discord.Activity(
+            type=types[index],
+            name=names[index].format(guilds=counts[0], users=counts[1])
+        )
+        self._dynamic_activities[(sequence, index)] = (counts, activity)
+        return activity
+    
+    def _sync_interval(self):
+        """Match the loop interval to the current sequence's pace"""
+        interval = self.config.intervals.get(self.current_sequence, self.animation_speed)
+        if interval != self.status_updater.seconds:
+            self.status_updater.change_interval(seconds=interval)
+    
+    async def _change_presence(self, activity: discord.Activity) -> bool:
+        """Send a presence update, counting it against the presence budget"""
+        # stop_animated_status may have cancelled the loop while this tick was running
+        if self.status_updater.is_being_cancelled():
+            return False
+        
+        self._recent_presences.append(time.monotonic())
+        await self.bot.change_presence(activity=activity)
+        return True
+    
+    @status_updater.error
+    async def on_status_updater_error(self, error):
+        """Log unexpected failures that stopped the status loop"""
+        logger.error("Animated status loop stopped by an unexpected error", exc_info=error)
     
     @status_updater.before_loop
     async def before_status_updater(self):
         """Wait for bot to be ready before starting status updates"""
         await self.bot.wait_until_ready()
     
+    @tasks.loop(minutes=5)
+    async def _count_refresher(self):
+        """Resync the cached counts in case a listener missed an event"""
+        self.refresh_counts()
+    
     async def trigger_search_animation(self):
         """Trigger search animation sequence"""
         await self.set_sequence('search', duration=8)
@@ -211,32 +441,14 @@ class AnimatedStatusManager:
     
     async def set_feature_status(self, feature: str):
         """Set status based on feature being used"""
-        feature_sequences = {
-            'music': 'music',
-            'song': 'music',
-            'book': 'books',
-            'manga': 'manga',
-            'comic': 'manga',
-            'gaming': 'gaming',
-            'rpg': 'gaming',
-            'search': 'search'
-        }
-        
-        sequence = feature_sequences.get(feature, 'default')
+        sequence = self.feature_sequences.get(feature, 'default')
         await self.set_sequence(sequence, duration=15)
 
-# Global status manager instance
-status_manager = None
-
-def get_status_manager(bot):
-    """Get or create status manager instance"""
-    global status_manager
-    if status_manager is None:
-        status_manager = AnimatedStatusManager(bot)
-    return status_manager
-
 async def setup_animated_status(bot):
     """Initialize animated status system"""
-    manager = get_status_manager(bot)
+    # on_ready can fire again after reconnects; keep the existing manager
+    manager = getattr(bot, 'status_manager', None)
+    if manager is None:
+        manager = bot.status_manager = AnimatedStatusManager(bot)
     await manager.start_animated_status()
     return manager
\ No newline at end of file
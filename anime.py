@@ -1,58 +1,124 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
+import heapq
+import json
 import logging
+import os
 import random
+import sys
+from collections import deque
 from datetime import datetime
+from functools import cache, lru_cache
+from typing import FrozenSet, NamedTuple, Tuple
 
 logger = logging.getLogger(__name__)
 
+ANIME_DB_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "anime_db.json")
+
+@cache
+def _load_anime_database():
+    """Parse the anime database once and share it between cog instances"""
+    with open(ANIME_DB_FILE, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+# Population size from which recommendations switch to Floyd's sampling
+FLOYD_SAMPLE_THRESHOLD = 512
+
+def _floyd_sample(population, k):
+    """Pick k distinct items in O(k) with Floyd's algorithm"""
+    n = len(population)
+    chosen = set()
+    for j in range(n - k, n):
+        i = random.randint(0, j)
+        chosen.add(j if i in chosen else i)
+    picks = [population[i] for i in chosen]
+    random.shuffle(picks)
+    return picks
+
+def _sample(population, k):
+    """Up to k distinct random items from population"""
+    k = min(k, len(population))
+    if len(population) >= FLOYD_SAMPLE_THRESHOLD:
+        return _floyd_sample(population, k)
+    return random.sample(population, k)
+
+def _is_word_char(ch):
+    """Whether ch would continue a word, so a name touching it isn't a whole-word mention"""
+    return ch.isalnum() or ch == "_"
+
+class _NameMatcher:
+    """Aho-Corasick automaton reporting which names occur as whole words inside a piece of text"""
+    def __init__(self, names):
+        self._lengths = [len(name) for name in names]
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]
+        
+        # Trie of every name, recording which names end at each state
+        for i, name in enumerate(names):
+            state = 0
+            for ch in name:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                state = nxt
+            self._out[state].append(i)
+        
+        # Failure links, breadth first so shorter suffixes are linked before longer ones
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+    
+    def find(self, text):
+        """Positions of every name found in text, in one pass over it"""
+        goto, fail, out, lengths = self._goto, self._fail, self._out, self._lengths
+        found = set()
+        state = 0
+        for end, ch in enumerate(text, 1):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if not out[state] or (end < len(text) and _is_word_char(text[end])):
+                continue
+            # Only whole-word mentions count, so "Ran" doesn't match inside "Grand"
+            for i in out[state]:
+                start = end - lengths[i]
+                if start == 0 or not _is_word_char(text[start - 1]):
+                    found.add(i)
+        return found
+
+class Anime(NamedTuple):
+    """An anime record with its embed text rendered up front"""
+    name: str
+    genre: str
+    rating: float
+    year: int
+    episodes: int
+    streaming: Tuple[str, ...]
+    tags: FrozenSet[str]
+    streaming_str: str
+    popular_value: str
+    recommend_value: str
+    platform_value: str
+
 class AnimeCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         
-        # Popular anime database (can be expanded)
-        self.anime_database = {
-            "action": [
-                {"name": "Attack on Titan", "genre": "Action, Drama", "rating": 9.0, "year": 2013, "episodes": 75, "streaming": ["Crunchyroll", "Funimation", "Hulu"]},
-                {"name": "Demon Slayer", "genre": "Action, Supernatural", "rating": 8.7, "year": 2019, "episodes": 44, "streaming": ["Crunchyroll", "Funimation", "Netflix"]},
-                {"name": "One Piece", "genre": "Action, Adventure", "rating": 9.0, "year": 1999, "episodes": 1000, "streaming": ["Crunchyroll", "Funimation", "Netflix"]},
-                {"name": "Naruto", "genre": "Action, Martial Arts", "rating": 8.4, "year": 2002, "episodes": 720, "streaming": ["Crunchyroll", "Funimation", "Hulu"]},
-                {"name": "Dragon Ball Z", "genre": "Action, Martial Arts", "rating": 8.8, "year": 1989, "episodes": 291, "streaming": ["Crunchyroll", "Funimation", "Hulu"]},
-                {"name": "My Hero Academia", "genre": "Action, School", "rating": 8.5, "year": 2016, "episodes": 138, "streaming": ["Crunchyroll", "Funimation", "Hulu"]},
-                {"name": "Jujutsu Kaisen", "genre": "Action, Supernatural", "rating": 8.6, "year": 2020, "episodes": 24, "streaming": ["Crunchyroll", "Funimation"]},
-                {"name": "Hunter x Hunter", "genre": "Action, Adventure", "rating": 9.1, "year": 2011, "episodes": 148, "streaming": ["Crunchyroll", "Netflix"]}
-            ],
-            "romance": [
-                {"name": "Your Name", "genre": "Romance, Drama", "rating": 8.2, "year": 2016, "episodes": 1, "streaming": ["Crunchyroll", "Funimation", "Netflix"]},
-                {"name": "A Silent Voice", "genre": "Romance, Drama", "rating": 8.1, "year": 2016, "episodes": 1, "streaming": ["Netflix", "Crunchyroll"]},
-                {"name": "Toradora!", "genre": "Romance, Comedy", "rating": 8.1, "year": 2008, "episodes": 25, "streaming": ["Crunchyroll", "Funimation"]},
-                {"name": "Kaguya-sama: Love is War", "genre": "Romance, Comedy", "rating": 8.4, "year": 2019, "episodes": 37, "streaming": ["Crunchyroll", "Funimation"]},
-                {"name": "Your Lie in April", "genre": "Romance, Music", "rating": 8.6, "year": 2014, "episodes": 22, "streaming": ["Crunchyroll", "Netflix"]},
-                {"name": "Clannad", "genre": "Romance, Drama", "rating": 8.0, "year": 2007, "episodes": 47, "streaming": ["Crunchyroll", "Funimation"]}
-            ],
-            "comedy": [
-                {"name": "One Punch Man", "genre": "Comedy, Action", "rating": 8.8, "year": 2015, "episodes": 24, "streaming": ["Crunchyroll", "Funimation", "Netflix"]},
-                {"name": "Gintama", "genre": "Comedy, Action", "rating": 9.0, "year": 2006, "episodes": 367, "streaming": ["Crunchyroll", "Funimation"]},
-                {"name": "Konosuba", "genre": "Comedy, Fantasy", "rating": 8.1, "year": 2016, "episodes": 20, "streaming": ["Crunchyroll", "Funimation"]},
-                {"name": "The Disastrous Life of Saiki K.", "genre": "Comedy, School", "rating": 8.4, "year": 2016, "episodes": 120, "streaming": ["Netflix", "Funimation"]},
-                {"name": "Mob Psycho 100", "genre": "Comedy, Supernatural", "rating": 8.7, "year": 2016, "episodes": 37, "streaming": ["Crunchyroll", "Funimation"]}
-            ],
-            "thriller": [
-                {"name": "Death Note", "genre": "Thriller, Supernatural", "rating": 9.0, "year": 2006, "episodes": 37, "streaming": ["Netflix", "Crunchyroll", "Funimation"]},
-                {"name": "Monster", "genre": "Thriller, Drama", "rating": 9.0, "year": 2004, "episodes": 74, "streaming": ["Netflix", "Crunchyroll"]},
-                {"name": "Psycho-Pass", "genre": "Thriller, Sci-Fi", "rating": 8.2, "year": 2012, "episodes": 41, "streaming": ["Crunchyroll", "Funimation"]},
-                {"name": "Steins;Gate", "genre": "Thriller, Sci-Fi", "rating": 8.8, "year": 2011, "episodes": 24, "streaming": ["Crunchyroll", "Funimation"]},
-                {"name": "Paranoia Agent", "genre": "Thriller, Mystery", "rating": 8.0, "year": 2004, "episodes": 13, "streaming": ["Crunchyroll", "Funimation"]}
-            ],
-            "slice_of_life": [
-                {"name": "Spirited Away", "genre": "Slice of Life, Fantasy", "rating": 9.3, "year": 2001, "episodes": 1, "streaming": ["Netflix", "HBO Max"]},
-                {"name": "My Neighbor Totoro", "genre": "Slice of Life, Family", "rating": 8.2, "year": 1988, "episodes": 1, "streaming": ["Netflix", "HBO Max"]},
-                {"name": "Violet Evergarden", "genre": "Slice of Life, Drama", "rating": 8.5, "year": 2018, "episodes": 13, "streaming": ["Netflix", "Crunchyroll"]},
-                {"name": "K-On!", "genre": "Slice of Life, Music", "rating": 7.8, "year": 2009, "episodes": 39, "streaming": ["Crunchyroll", "Funimation"]},
-                {"name": "Barakamon", "genre": "Slice of Life, Comedy", "rating": 8.3, "year": 2014, "episodes": 12, "streaming": ["Crunchyroll", "Funimation"]}
-            ]
-        }
+        # Popular anime database (can be expanded in anime_db.json)
+        raw_database = _load_anime_database()
         
         # Streaming platform emojis
         self.streaming_emojis = {
@@ -64,36 +130,335 @@ class AnimeCog(commands.Cog):
             "Amazon Prime": "🔵",
             "Disney+": "⚪"
         }
+        
+        # One shared string per platform name across every record
+        self._platform_names = {platform: sys.intern(platform) for platform in self.streaming_emojis}
+        
+        # Freeze each record, with its embed text rendered once
+        self.anime_database = {
+            genre: tuple(self._build_anime(record) for record in records)
+            for genre, records in raw_database.items()
+        }
+        
+        # Derived lookups, built once since the database doesn't change at runtime
+        self._all_anime = tuple(anime for genre_list in self.anime_database.values() for anime in genre_list)
+        self._popular = tuple(sorted(self._all_anime, key=lambda x: x.rating, reverse=True))
+        self._by_name_cf = {anime.name.casefold(): anime for anime in self._all_anime}
+        
+        # Case-folded names by position, plus trigram -> positions for partial name search
+        self._names_cf = tuple(anime.name.casefold() for anime in self._all_anime)
+        self._trigram_index = {}
+        for i, name in enumerate(self._names_cf):
+            for trigram in self._trigrams(name):
+                self._trigram_index.setdefault(trigram, set()).add(i)
+        
+        # Automaton over the same names, for queries that contain a full anime name
+        self._name_matcher = _NameMatcher(self._names_cf)
+        
+        # Genre tag -> positions in database order, for "similar anime"
+        self._by_tag = {}
+        for i, anime in enumerate(self._all_anime):
+            for tag in anime.tags:
+                self._by_tag.setdefault(tag, []).append(i)
+        
+        # Case-folded platform -> anime on it, best rated first
+        self._by_platform = {}
+        for anime in self._popular:
+            for platform in anime.streaming:
+                self._by_platform.setdefault(platform.casefold(), []).append(anime)
+        self._available_platforms = sorted({
+            platform for anime in self._all_anime for platform in anime.streaming
+        })
+        self._available_platforms_str = ", ".join(self._available_platforms)
+        
+        # Responses are pure functions of the query, so repeat queries reuse the rendered embed.
+        # Cached dicts are shared; never mutate an embed built from one.
+        self._search_payload = lru_cache(maxsize=256)(self._build_search_payload)
+        self._streaming_payload = lru_cache(maxsize=256)(self._build_streaming_payload)
+        
+        # Listings that depend only on the database, built once and sent as-is
+        self._genres_embed = self._build_genres_embed()
+        self._platforms_embed = self._build_platforms_embed()
+        self._popular_embed = self._build_popular_embed()
+    
+    def _build_anime(self, record):
+        """Turn a raw database entry into an Anime with pre-rendered field values"""
+        streaming = tuple(
+            self._platform_names.get(platform) or sys.intern(platform)
+            for platform in record.get('streaming', ())
+        )
+        streaming_str = self._format_streaming_platforms(streaming)
+        popular_value = (
+            f"**Genre:** {record['genre']}\n"
+            f"**Rating:** {record['rating']}/10\n"
+            f"**Year:** {record['year']}\n"
+            f"**Episodes:** {record['episodes']}"
+        )
+        return Anime(
+            name=record['name'],
+            genre=record['genre'],
+            rating=record['rating'],
+            year=record['year'],
+            episodes=record['episodes'],
+            streaming=streaming,
+            tags=frozenset(record['genre'].split(', ')),
+            streaming_str=streaming_str,
+            popular_value=popular_value,
+            recommend_value=f"{popular_value}\n**Streaming:** {streaming_str}",
+            platform_value=(
+                f"**Genre:** {record['genre']}\n"
+                f"**Year:** {record['year']}\n"
+                f"**Episodes:** {record['episodes']}\n"
+                f"**Streaming:** {streaming_str}"
+            )
+        )
+    
+    def _find_on_platform(self, platform):
+        """Anime on any platform whose name contains the query, best rated first"""
+        query = platform.casefold()
+        exact = self._by_platform.get(query)
+        if exact is not None:
+            return exact
+        
+        matches = {
+            anime
+            for name, anime_list in self._by_platform.items() if query in name
+            for anime in anime_list
+        }
+        return [anime for anime in self._popular if anime in matches]
+    
+    @staticmethod
+    def _trigrams(text):
+        """Every 3-character substring of text"""
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+    
+    def _similar_anime(self, found_anime, limit=3):
+        """Names of anime sharing a genre tag with found_anime, in database order"""
+        similar = []
+        last = None
+        for i in heapq.merge(*(self._by_tag[tag] for tag in found_anime.tags)):
+            anime = self._all_anime[i]
+            if i == last or anime is found_anime:
+                continue
+            last = i
+            similar.append(anime.name)
+            if len(similar) == limit:
+                break
+        return similar
+    
+    def _find_anime(self, anime_name):
+        """Find an anime by exact name, then the first partial match, then a name inside the query"""
+        query = anime_name.casefold()
+        found_anime = self._by_name_cf.get(query)
+        if found_anime is not None:
+            return found_anime
+        
+        if len(query) < 3:
+            candidates = range(len(self._names_cf))
+        else:
+            # A name containing the query must contain every one of its trigrams
+            postings = [self._trigram_index.get(trigram) for trigram in self._trigrams(query)]
+            candidates = sorted(set.intersection(*postings)) if all(postings) else ()
+        
+        found_anime = next((self._all_anime[i] for i in candidates if query in self._names_cf[i]), None)
+        if found_anime is not None:
+            return found_anime
+        
+        # Otherwise the query may contain a name, e.g. "attack on titan season 2"; prefer the longest
+        contained = self._name_matcher.find(query)
+        if not contained:
+            return None
+        return self._all_anime[max(contained, key=lambda i: (len(self._names_cf[i]), -i))]
+    
+    def _build_search_payload(self, anime_name):
+        """Embed dict for an anime_search query"""
+        # Search through our database
+        found_anime = self._find_anime(anime_name)
+        
+        if not found_anime:
+            embed = discord.Embed(
+                title="❌ Anime Not Found",
+                description=f"Sorry, '{anime_name}' was not found in our database.",
+                color=discord.Color.red()
+            )
+            
+            embed.add_field(
+                name="💡 Suggestions",
+                value="• Try using `/anime_recommend` for random suggestions\n"
+                      "• Check spelling and try again\n"
+                      "• Use `/anime_popular` to see trending anime",
+                inline=False
+            )
+            
+            return embed.to_dict()
+        
+        embed = discord.Embed(
+            title=f"🎌 {found_anime.name}",
+            description="Here's what I found about this anime:",
+            color=discord.Color.blue()
+        )
+        
+        embed.add_field(
+            name="🎭 Genre",
+            value=found_anime.genre,
+            inline=True
+        )
+        
+        embed.add_field(
+            name="⭐ Rating",
+            value=f"{found_anime.rating}/10",
+            inline=True
+        )
+        
+        embed.add_field(
+            name="📅 Year",
+            value=found_anime.year,
+            inline=True
+        )
+        
+        embed.add_field(
+            name="📺 Episodes",
+            value=found_anime.episodes,
+            inline=True
+        )
+        
+        # Add streaming information
+        embed.add_field(
+            name="🎬 Available On",
+            value=found_anime.streaming_str,
+            inline=False
+        )
+        
+        # Add recommendation based on genre
+        similar_anime = self._similar_anime(found_anime)
+        
+        if similar_anime:
+            embed.add_field(
+                name="💡 Similar Anime",
+                value=", ".join(similar_anime),
+                inline=False
+            )
+        
+        embed.set_footer(text="Use /anime_recommend for more suggestions!")
+        return embed.to_dict()
+    
+    def _build_streaming_payload(self, platform):
+        """Embed dict for an anime_streaming query"""
+        # Case-insensitive, partial platform match
+        platform_anime = self._find_on_platform(platform)
+        
+        if not platform_anime:
+            embed = discord.Embed(
+                title=f"❌ No Anime Found on {platform}",
+                description=f"Sorry, no anime found for '{platform}' in our database.",
+                color=discord.Color.red()
+            )
+            
+            embed.add_field(
+                name="📺 Available Platforms",
+                value=self._available_platforms_str,
+                inline=False
+            )
+            
+            return embed.to_dict()
+        
+        # Already sorted by rating; limit to top 10
+        platform_anime = platform_anime[:10]
+        
+        embed = discord.Embed(
+            title=f"📺 Anime on {platform}",
+            description=f"Here are the top anime available on {platform}:",
+            color=discord.Color.blue()
+        )
+        
+        add_field = embed.add_field
+        for anime in platform_anime:
+            add_field(
+                name=f"{anime.name} ({anime.rating}/10)",
+                value=anime.platform_value,
+                inline=True
+            )
+        
+        embed.set_footer(text=f"Found {len(platform_anime)} anime on {platform}")
+        return embed.to_dict()
+    
+    def _build_genres_embed(self):
+        """Embed listing every genre with its anime count"""
+        embed = discord.Embed(
+            title="🎌 Available Anime Genres",
+            description="Here are the genres you can search for:",
+            color=discord.Color.purple()
+        )
+        
+        for genre, anime_list in self.anime_database.items():
+            embed.add_field(
+                name=genre.replace('_', ' ').title(),
+                value=f"{len(anime_list)} anime available",
+                inline=True
+            )
+        
+        embed.add_field(
+            name="💡 How to Use",
+            value="Use `/anime_recommend genre:action` to get recommendations from a specific genre!",
+            inline=False
+        )
+        return embed
+    
+    def _build_platforms_embed(self):
+        """Embed listing every streaming platform with its anime count"""
+        embed = discord.Embed(
+            title="📺 Available Streaming Platforms",
+            description="Here are all the streaming platforms in our database:",
+            color=discord.Color.green()
+        )
+        
+        for platform in self._available_platforms:
+            emoji = self.streaming_emojis.get(platform, "📺")
+            embed.add_field(
+                name=f"{emoji} {platform}",
+                value=f"{len(self._by_platform[platform.casefold()])} anime available\n"
+                      f"Use `/anime_streaming platform:{platform}` to browse",
+                inline=True
+            )
+        
+        embed.set_footer(text="Click on a platform to see available anime!")
+        return embed
+    
+    def _build_popular_embed(self):
+        """Embed listing the top rated anime across all genres"""
+        embed = discord.Embed(
+            title="🔥 Popular Anime",
+            description="Here are the most popular anime based on ratings:",
+            color=discord.Color.gold()
+        )
+        
+        # Top 8 by rating across all genres
+        for i, anime in enumerate(self._popular[:8], 1):
+            embed.add_field(name=f"{i}. {anime.name}", value=anime.popular_value, inline=True)
+        
+        embed.set_footer(text="Rankings based on community ratings")
+        return embed
     
     def _format_streaming_platforms(self, platforms):
         """Format streaming platforms with emojis"""
         if not platforms:
             return "Not available"
         
-        formatted = []
-        for platform in platforms:
-            emoji = self.streaming_emojis.get(platform, "📺")
-            formatted.append(f"{emoji} {platform}")
-        
-        return " | ".join(formatted)
+        emojis = self.streaming_emojis
+        return " | ".join(f"{emojis.get(platform, '📺')} {platform}" for platform in platforms)
     
     @app_commands.command(name="anime_recommend", description="Get anime recommendations")
     @app_commands.describe(genre="Genre preference (action, romance, comedy, thriller, slice_of_life)")
     async def anime_recommend(self, interaction: discord.Interaction, genre: str = ""):
         """Get anime recommendations based on genre"""
-        await interaction.response.defer()
-        
         try:
-            if genre.lower() in self.anime_database:
-                anime_list = self.anime_database[genre.lower()]
-                recommendations = random.sample(anime_list, min(5, len(anime_list)))
+            anime_list = self.anime_database.get(genre.casefold())
+            if anime_list is not None:
+                recommendations = _sample(anime_list, 5)
                 title = f"🎌 {genre.title()} Anime Recommendations"
             else:
                 # Random recommendations from all genres
-                all_anime = []
-                for genre_list in self.anime_database.values():
-                    all_anime.extend(genre_list)
-                recommendations = random.sample(all_anime, min(5, len(all_anime)))
+                recommendations = _sample(self._all_anime, 5)
                 title = "🎌 Random Anime Recommendations"
             
             embed = discord.Embed(
@@ -102,299 +467,71 @@ class AnimeCog(commands.Cog):
                 color=discord.Color.purple()
             )
             
+            add_field = embed.add_field
             for anime in recommendations:
-                streaming_info = self._format_streaming_platforms(anime.get('streaming', []))
-                embed.add_field(
-                    name=anime['name'],
-                    value=f"**Genre:** {anime['genre']}\n"
-                          f"**Rating:** {anime['rating']}/10\n"
-                          f"**Year:** {anime['year']}\n"
-                          f"**Episodes:** {anime['episodes']}\n"
-                          f"**Streaming:** {streaming_info}",
+                add_field(
+                    name=anime.name,
+                    value=anime.recommend_value,
                     inline=True
                 )
             
             embed.set_footer(text="Happy watching! 🍿")
-            await interaction.followup.send(embed=embed)
+            await interaction.response.send_message(embed=embed)
             
         except Exception as e:
             logger.error(f"Error getting anime recommendations: {e}")
-            await interaction.followup.send(f"❌ Error getting recommendations: {str(e)}")
+            await interaction.response.send_message(f"❌ Error getting recommendations: {str(e)}")
     
     @app_commands.command(name="anime_search", description="Search for anime information")
     @app_commands.describe(anime_name="Name of the anime to search for")
     async def anime_search(self, interaction: discord.Interaction, anime_name: str):
         """Search for specific anime information"""
-        await interaction.response.defer()
-        
         try:
-            # Search through our database
-            found_anime = None
-            for genre_list in self.anime_database.values():
-                for anime in genre_list:
-                    if anime_name.lower() in anime['name'].lower():
-                        found_anime = anime
-                        break
-                if found_anime:
-                    break
-            
-            if not found_anime:
-                embed = discord.Embed(
-                    title="❌ Anime Not Found",
-                    description=f"Sorry, '{anime_name}' was not found in our database.",
-                    color=discord.Color.red()
-                )
-                
-                embed.add_field(
-                    name="💡 Suggestions",
-                    value="• Try using `/anime_recommend` for random suggestions\n"
-                          "• Check spelling and try again\n"
-                          "• Use `/anime_popular` to see trending anime",
-                    inline=False
-                )
-                
-                await interaction.followup.send(embed=embed)
-                return
-            
-            embed = discord.Embed(
-                title=f"🎌 {found_anime['name']}",
-                description="Here's what I found about this anime:",
-                color=discord.Color.blue()
-            )
-            
-            embed.add_field(
-                name="🎭 Genre",
-                value=found_anime['genre'],
-                inline=True
-            )
-            
-            embed.add_field(
-                name="⭐ Rating",
-                value=f"{found_anime['rating']}/10",
-                inline=True
-            )
-            
-            embed.add_field(
-                name="📅 Year",
-                value=found_anime['year'],
-                inline=True
-            )
-            
-            embed.add_field(
-                name="📺 Episodes",
-                value=found_anime['episodes'],
-                inline=True
-            )
-            
-            # Add streaming information
-            streaming_info = self._format_streaming_platforms(found_anime.get('streaming', []))
-            embed.add_field(
-                name="🎬 Available On",
-                value=streaming_info,
-                inline=False
-            )
-            
-            # Add recommendation based on genre
-            similar_anime = []
-            for genre_list in self.anime_database.values():
-                for anime in genre_list:
-                    if anime != found_anime and any(g in anime['genre'] for g in found_anime['genre'].split(', ')):
-                        similar_anime.append(anime['name'])
-            
-            if similar_anime:
-                embed.add_field(
-                    name="💡 Similar Anime",
-                    value=", ".join(similar_anime[:3]),
-                    inline=False
-                )
-            
-            embed.set_footer(text="Use /anime_recommend for more suggestions!")
-            await interaction.followup.send(embed=embed)
+            embed = discord.Embed.from_dict(self._search_payload(anime_name))
+            await interaction.response.send_message(embed=embed)
             
         except Exception as e:
             logger.error(f"Error searching anime: {e}")
-            await interaction.followup.send(f"❌ Error searching anime: {str(e)}")
+            await interaction.response.send_message(f"❌ Error searching anime: {str(e)}")
     
     @app_commands.command(name="anime_popular", description="Get popular anime")
     async def anime_popular(self, interaction: discord.Interaction):
         """Get popular anime"""
-        await interaction.response.defer()
-        
         try:
-            # Get top rated anime from all genres
-            all_anime = []
-            for genre_list in self.anime_database.values():
-                all_anime.extend(genre_list)
-            
-            # Sort by rating and get top 8
-            popular_anime = sorted(all_anime, key=lambda x: x['rating'], reverse=True)[:8]
-            
-            embed = discord.Embed(
-                title="🔥 Popular Anime",
-                description="Here are the most popular anime based on ratings:",
-                color=discord.Color.gold()
-            )
-            
-            for i, anime in enumerate(popular_anime, 1):
-                embed.add_field(
-                    name=f"{i}. {anime['name']}",
-                    value=f"**Genre:** {anime['genre']}\n"
-                          f"**Rating:** {anime['rating']}/10\n"
-                          f"**Year:** {anime['year']}\n"
-                          f"**Episodes:** {anime['episodes']}",
-                    inline=True
-                )
-            
-            embed.set_footer(text="Rankings based on community ratings")
-            await interaction.followup.send(embed=embed)
+            await interaction.response.send_message(embed=self._popular_embed)
             
         except Exception as e:
             logger.error(f"Error getting popular anime: {e}")
-            await interaction.followup.send(f"❌ Error getting popular anime: {str(e)}")
+            await interaction.response.send_message(f"❌ Error getting popular anime: {str(e)}")
     
     @app_commands.command(name="anime_genres", description="List available anime genres")
     async def anime_genres(self, interaction: discord.Interaction):
         """List available anime genres"""
-        embed = discord.Embed(
-            title="🎌 Available Anime Genres",
-            description="Here are the genres you can search for:",
-            color=discord.Color.purple()
-        )
-        
-        for genre in self.anime_database.keys():
-            anime_count = len(self.anime_database[genre])
-            embed.add_field(
-                name=genre.replace('_', ' ').title(),
-                value=f"{anime_count} anime available",
-                inline=True
-            )
-        
-        embed.add_field(
-            name="💡 How to Use",
-            value="Use `/anime_recommend genre:action` to get recommendations from a specific genre!",
-            inline=False
-        )
-        
-        await interaction.response.send_message(embed=embed)
+        await interaction.response.send_message(embed=self._genres_embed)
     
     @app_commands.command(name="anime_streaming", description="Find anime by streaming platform")
     @app_commands.describe(platform="Streaming platform (Netflix, Crunchyroll, Funimation, Hulu, etc.)")
     async def anime_streaming(self, interaction: discord.Interaction, platform: str):
         """Find anime available on a specific streaming platform"""
-        await interaction.response.defer()
-        
         try:
-            platform_anime = []
-            
-            # Search through all anime for the specified platform
-            for genre_list in self.anime_database.values():
-                for anime in genre_list:
-                    if 'streaming' in anime:
-                        # Case-insensitive search for platform
-                        if any(platform.lower() in p.lower() for p in anime['streaming']):
-                            platform_anime.append(anime)
-            
-            if not platform_anime:
-                embed = discord.Embed(
-                    title=f"❌ No Anime Found on {platform}",
-                    description=f"Sorry, no anime found for '{platform}' in our database.",
-                    color=discord.Color.red()
-                )
-                
-                available_platforms = set()
-                for genre_list in self.anime_database.values():
-                    for anime in genre_list:
-                        if 'streaming' in anime:
-                            available_platforms.update(anime['streaming'])
-                
-                embed.add_field(
-                    name="📺 Available Platforms",
-                    value=", ".join(sorted(available_platforms)),
-                    inline=False
-                )
-                
-                await interaction.followup.send(embed=embed)
-                return
-            
-            # Sort by rating and limit to top 10
-            platform_anime.sort(key=lambda x: x['rating'], reverse=True)
-            platform_anime = platform_anime[:10]
-            
-            embed = discord.Embed(
-                title=f"📺 Anime on {platform}",
-                description=f"Here are the top anime available on {platform}:",
-                color=discord.Color.blue()
-            )
-            
-            for anime in platform_anime:
-                streaming_info = self._format_streaming_platforms(anime.get('streaming', []))
-                embed.add_field(
-                    name=f"{anime['name']} ({anime['rating']}/10)",
-                    value=f"**Genre:** {anime['genre']}\n"
-                          f"**Year:** {anime['year']}\n"
-                          f"**Episodes:** {anime['episodes']}\n"
-                          f"**Streaming:** {streaming_info}",
-                    inline=True
-                )
-            
-            embed.set_footer(text=f"Found {len(platform_anime)} anime on {platform}")
-            await interaction.followup.send(embed=embed)
+            embed = discord.Embed.from_dict(self._streaming_payload(platform))
+            await interaction.response.send_message(embed=embed)
             
         except Exception as e:
             logger.error(f"Error searching anime by platform: {e}")
-            await interaction.followup.send(f"❌ Error searching anime by platform: {str(e)}")
+            await interaction.response.send_message(f"❌ Error searching anime by platform: {str(e)}")
     
     @app_commands.command(name="anime_platforms", description="View all available streaming platforms")
     async def anime_platforms(self, interaction: discord.Interaction):
         """View all available streaming platforms"""
-        try:
-            # Collect all platforms from database
-            platforms = {}
-            for genre_list in self.anime_database.values():
-                for anime in genre_list:
-                    if 'streaming' in anime:
-                        for platform in anime['streaming']:
-                            if platform not in platforms:
-                                platforms[platform] = []
-                            platforms[platform].append(anime['name'])
-            
-            embed = discord.Embed(
-                title="📺 Available Streaming Platforms",
-                description="Here are all the streaming platforms in our database:",
-                color=discord.Color.green()
-            )
-            
-            for platform, anime_list in sorted(platforms.items()):
-                emoji = self.streaming_emojis.get(platform, "📺")
-                embed.add_field(
-                    name=f"{emoji} {platform}",
-                    value=f"{len(anime_list)} anime available\n"
-                          f"Use `/anime_streaming platform:{platform}` to browse",
-                    inline=True
-                )
-            
-            embed.set_footer(text="Click on a platform to see available anime!")
-            await interaction.response.send_message(embed=embed)
-            
-        except Exception as e:
-            logger.error(f"Error getting streaming platforms: {e}")
-            await interaction.response.send_message(f"❌ Error getting streaming platforms: {str(e)}")
+        await interaction.response.send_message(embed=self._platforms_embed)
     
     @app_commands.command(name="anime_where_to_watch", description="Find where to watch a specific anime")
     @app_commands.describe(anime_name="Name of the anime to find streaming platforms for")
     async def anime_where_to_watch(self, interaction: discord.Interaction, anime_name: str):
         """Find where to watch a specific anime"""
-        await interaction.response.defer()
-        
         try:
-            found_anime = None
-            for genre_list in self.anime_database.values():
-                for anime in genre_list:
-                    if anime_name.lower() in anime['name'].lower():
-                        found_anime = anime
-                        break
-                if found_anime:
-                    break
+            found_anime = self._find_anime(anime_name)
             
             if not found_anime:
                 embed = discord.Embed(
@@ -411,50 +548,48 @@ class AnimeCog(commands.Cog):
                     inline=False
                 )
                 
-                await interaction.followup.send(embed=embed)
+                await interaction.response.send_message(embed=embed)
                 return
             
-            streaming_info = self._format_streaming_platforms(found_anime.get('streaming', []))
-            
             embed = discord.Embed(
-                title=f"📺 Where to Watch: {found_anime['name']}",
+                title=f"📺 Where to Watch: {found_anime.name}",
                 description="Here's where you can stream this anime:",
                 color=discord.Color.blue()
             )
             
             embed.add_field(
                 name="🎭 Genre",
-                value=found_anime['genre'],
+                value=found_anime.genre,
                 inline=True
             )
             
             embed.add_field(
                 name="⭐ Rating",
-                value=f"{found_anime['rating']}/10",
+                value=f"{found_anime.rating}/10",
                 inline=True
             )
             
             embed.add_field(
                 name="📅 Year",
-                value=found_anime['year'],
+                value=found_anime.year,
                 inline=True
             )
             
             embed.add_field(
                 name="📺 Episodes",
-                value=found_anime['episodes'],
+                value=found_anime.episodes,
                 inline=True
             )
             
             embed.add_field(
                 name="🎬 Available On",
-                value=streaming_info,
+                value=found_anime.streaming_str,
                 inline=False
             )
             
             embed.set_footer(text="Happy watching! 🍿")
-            await interaction.followup.send(embed=embed)
+            await interaction.response.send_message(embed=embed)
             
         except Exception as e:
             logger.error(f"Error finding where to watch anime: {e}")
-            await interaction.followup.send(f"❌ Error finding where to watch anime: {str(e)}")
+            await interaction.response.send_message(f"❌ Error finding where to watch anime: {str(e)}")
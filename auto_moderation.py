@@ -2,13 +2,52 @@ import discord
 from discord.ext import commands, tasks
 import logging
 import re
-import asyncio
+import string
+import sys
+import time
 from datetime import datetime, timedelta
-from collections import defaultdict, deque
+from collections import Counter, defaultdict, deque
+from typing import NamedTuple
+from urllib.parse import urlsplit
 import aiohttp
 
 logger = logging.getLogger(__name__)
 
+class CachedMessage(NamedTuple):
+    """What spam and duplicate detection keep of a message"""
+    normalized: str  # Lowercased, stripped content, interned when short
+    timestamp: float  # time.monotonic() when it arrived
+    channel: int
+
+# Buffered violations are written at least this often, or sooner once this many pile up
+VIOLATION_FLUSH_SECONDS = 1
+VIOLATION_FLUSH_SIZE = 100
+
+# Only contents up to this long are interned; interned strings may never be freed on newer Pythons
+MAX_INTERNED_LENGTH = 200
+
+# How long an administrator permission check is reused before asking discord.py again
+ADMIN_CACHE_SECONDS = 60
+
+# Patterns used on every message, compiled once
+URL_RE = re.compile(r'https?://(?:[-\w.])+(?:[:\d]+)?(?:/(?:[\w/_.])*(?:\?(?:[\w&=%.])*)?(?:#(?:[\w.])*)?)?')
+INVITE_RE = re.compile(r'discord\.gg/\w+|discord(?:app)?\.com/invite/\w+', re.IGNORECASE)
+CUSTOM_EMOJI_RE = re.compile(r'<:\w+:\d+>')
+SUSPICIOUS_URL_RE = re.compile(
+    r'bit\.ly|tinyurl\.com|goo\.gl|t\.co|discord-gift|discordapp-gift|nitro-gift',
+    re.IGNORECASE
+)
+
+# Deletes A-Z, so the caps count of ASCII text is the drop in length
+ASCII_UPPER_DELETE = str.maketrans('', '', string.ascii_uppercase)
+
+# Invites, URLs and custom emojis in one pass; the invite is a lookahead so it never hides a URL
+CONTENT_SCAN_RE = re.compile(
+    rf'(?=(?P<invite>(?i:{INVITE_RE.pattern})))'
+    rf'|(?P<url>{URL_RE.pattern})'
+    rf'|(?P<custom_emoji>{CUSTOM_EMOJI_RE.pattern})'
+)
+
 class AutoModerationSystem:
     def __init__(self, bot):
         self.bot = bot
@@ -16,8 +55,9 @@ class AutoModerationSystem:
         
         # Spam detection settings
         self.message_cache = defaultdict(lambda: deque(maxlen=10))  # Store last 10 messages per user
+        self.content_counts = defaultdict(Counter)  # Normalized content -> copies in each user's cache
         self.user_violations = defaultdict(int)  # Track violations per user
-        self.cooldowns = defaultdict(datetime)  # Track user cooldowns
+        self.cooldowns = {}  # Track user cooldowns, as time.monotonic() deadlines
         
         # Auto-moderation settings
         self.settings = {
@@ -39,11 +79,22 @@ class AutoModerationSystem:
             'duplicate_filter': True,
             'mention_filter': True,
             'emoji_filter': True,
+            'bad_words_filter': True,
+            'fast_fail': True,  # Stop at the first violation found
             'automod_enabled': True
         }
+        self._bad_words_re = self._compile_bad_words(self.settings['bad_words'])
+        self._link_whitelist = frozenset(domain.lower() for domain in self.settings['link_whitelist'])
+        
+        # Violations waiting to be written to the database in one batch
+        self._violation_buffer = []
+        
+        # (guild_id, user_id) -> (is_admin, expiry), so chatty admins don't recompute permissions per message
+        self._admin_cache = {}
         
         # Start background tasks
         self.cleanup_task.start()
+        self.flush_violations.start()
     
     async def check_message(self, message):
         """Main auto-moderation check function"""
@@ -53,40 +104,26 @@ class AutoModerationSystem:
         if message.author.bot:
             return False
             
+        # Monotonic seconds, shared by every timing check below
+        now = time.monotonic()
+        
         # Skip if user has admin permissions
-        if message.author.guild_permissions.administrator:
+        if self.is_admin(message, now):
             return False
             
         # Skip if user is in cooldown
-        if self.is_user_in_cooldown(message.author.id):
+        if self.is_user_in_cooldown(message.author.id, now):
             return False
         
-        violations = []
+        # Lowercased and stripped once, for duplicate detection and the message cache
+        normalized = message.content.lower().strip()
         
         # Check for various violations
-        if self.settings['spam_filter'] and await self.check_spam(message):
-            violations.append("spam")
-            
-        if self.settings['duplicate_filter'] and await self.check_duplicate(message):
-            violations.append("duplicate_message")
-            
-        if self.settings['caps_filter'] and await self.check_caps(message):
-            violations.append("excessive_caps")
-            
-        if self.settings['link_filter'] and await self.check_links(message):
-            violations.append("suspicious_link")
-            
-        if self.settings['invite_filter'] and await self.check_invites(message):
-            violations.append("discord_invite")
-            
-        if self.settings['mention_filter'] and await self.check_mentions(message):
-            violations.append("excessive_mentions")
-            
-        if self.settings['emoji_filter'] and await self.check_emojis(message):
-            violations.append("excessive_emojis")
-            
-        if await self.check_bad_words(message):
-            violations.append("inappropriate_content")
+        violations = []
+        for violation in self.find_violations(message, now, normalized):
+            violations.append(violation)
+            if self.settings['fast_fail']:
+                break
         
         # Take action if violations found
         if violations:
@@ -94,135 +131,213 @@ class AutoModerationSystem:
             return True
             
         # Store message for spam detection
-        self.message_cache[message.author.id].append({
-            'content': message.content,
-            'timestamp': message.created_at,
-            'channel': message.channel.id
-        })
+        self.cache_message(message, now, normalized)
         
         return False
     
-    async def check_spam(self, message):
+    def is_admin(self, message, now):
+        """Check if the author is an administrator, reusing a recent answer"""
+        key = (message.guild.id, message.author.id)
+        cached = self._admin_cache.get(key)
+        if cached is not None and now < cached[1]:
+            return cached[0]
+        
+        is_admin = message.author.guild_permissions.administrator
+        self._admin_cache[key] = (is_admin, now + ADMIN_CACHE_SECONDS)
+        return is_admin
+    
+    def forget_admin_status(self, guild_id, user_id):
+        """Drop a cached admin check, e.g. after the member's roles change"""
+        self._admin_cache.pop((guild_id, user_id), None)
+    
+    def find_violations(self, message, now, normalized):
+        """Yield each violation in the message, cheapest checks first"""
+        settings = self.settings
+        
+        if settings['mention_filter'] and self.check_mentions(message):
+            yield "excessive_mentions"
+            
+        if settings['spam_filter'] and self.check_spam(message, now):
+            yield "spam"
+            
+        if settings['duplicate_filter'] and self.check_duplicate(message, normalized):
+            yield "duplicate_message"
+            
+        if settings['caps_filter'] and self.check_caps(message):
+            yield "excessive_caps"
+            
+        if settings['bad_words_filter'] and self.check_bad_words(message):
+            yield "inappropriate_content"
+        
+        # Links, invites and emojis all come from a single scan of the content
+        if settings['link_filter'] or settings['invite_filter'] or settings['emoji_filter']:
+            scan = self._scan_content(message.content)
+            
+            if settings['invite_filter'] and self.check_invites(scan):
+                yield "discord_invite"
+                
+            if settings['link_filter'] and self.check_links(scan):
+                yield "suspicious_link"
+                
+            if settings['emoji_filter'] and self.check_emojis(message, scan):
+                yield "excessive_emojis"
+    
+    def cache_message(self, message, now, normalized):
+        """Add a message to its author's history, keeping the duplicate counts in step"""
+        history = self.message_cache[message.author.id]
+        counts = self.content_counts[message.author.id]
+        
+        # The deque is about to drop its oldest message
+        if len(history) == history.maxlen:
+            self._forget_oldest(history, counts)
+        
+        # Short contents are interned so repeats share one string between the deque and the counts
+        if len(normalized) <= MAX_INTERNED_LENGTH:
+            normalized = sys.intern(normalized)
+        history.append(CachedMessage(normalized, now, message.channel.id))
+        counts[normalized] += 1
+    
+    @staticmethod
+    def _forget_oldest(history, counts):
+        """Drop the oldest cached message and its duplicate count"""
+        oldest = history.popleft().normalized
+        counts[oldest] -= 1
+        if not counts[oldest]:
+            del counts[oldest]
+    
+    def check_spam(self, message, now):
         """Check for spam based on message frequency"""
         user_id = message.author.id
-        now = message.created_at
-        
-        # Count recent messages
-        recent_messages = [
-            msg for msg in self.message_cache[user_id]
-            if (now - msg['timestamp']).total_seconds() <= self.settings['spam_window']
-        ]
+        cutoff = now - self.settings['spam_window']
+        threshold = self.settings['spam_threshold']
+        
+        # Count recent messages newest first, stopping at the window edge or the threshold
+        recent_count = 0
+        for msg in reversed(self.message_cache.get(user_id, ())):
+            if msg.timestamp < cutoff:
+                break
+            recent_count += 1
+            if recent_count >= threshold:
+                return True
         
-        return len(recent_messages) >= self.settings['spam_threshold']
+        return False
     
-    async def check_duplicate(self, message):
+    def check_duplicate(self, message, normalized):
         """Check for duplicate messages"""
         user_id = message.author.id
-        content = message.content.lower().strip()
         
-        if not content:
+        if not normalized:
             return False
             
-        # Count identical messages
-        duplicate_count = sum(
-            1 for msg in self.message_cache[user_id]
-            if msg['content'].lower().strip() == content
-        )
-        
-        return duplicate_count >= self.settings['duplicate_threshold']
+        # Identical messages already in the user's cache
+        counts = self.content_counts.get(user_id)
+        return counts is not None and counts[normalized] >= self.settings['duplicate_threshold']
     
-    async def check_caps(self, message):
+    def check_caps(self, message):
         """Check for excessive caps"""
         content = message.content
         if len(content) < 10:  # Skip short messages
             return False
             
-        caps_count = sum(1 for char in content if char.isupper())
+        if content.isascii():
+            caps_count = len(content) - len(content.translate(ASCII_UPPER_DELETE))
+        else:
+            caps_count = sum(map(str.isupper, content))
         caps_ratio = caps_count / len(content)
         
         return caps_ratio >= self.settings['caps_threshold']
     
-    async def check_links(self, message):
+    def _scan_content(self, content):
+        """Collect URLs, invite presence and custom emoji count from one pass over content"""
+        urls = []
+        has_invite = False
+        custom_emoji_count = 0
+        
+        for match in CONTENT_SCAN_RE.finditer(content):
+            kind = match.lastgroup
+            if kind == 'url':
+                urls.append(match.group())
+            elif kind == 'invite':
+                has_invite = True
+            else:
+                custom_emoji_count += 1
+        
+        # An invite starting inside an already-consumed URL needs its own look
+        if urls and not has_invite:
+            has_invite = INVITE_RE.search(content) is not None
+        
+        return {'urls': urls, 'invite': has_invite, 'custom_emojis': custom_emoji_count}
+    
+    def check_links(self, scan):
         """Check for suspicious links"""
-        content = message.content
-        
-        # Find URLs
-        url_pattern = r'https?://(?:[-\w.])+(?:[:\d]+)?(?:/(?:[\w/_.])*(?:\?(?:[\w&=%.])*)?(?:#(?:[\w.])*)?)?'
-        urls = re.findall(url_pattern, content)
+        urls = scan['urls']
         
         if not urls:
             return False
         
         # Check against whitelist
         for url in urls:
-            is_whitelisted = any(domain in url for domain in self.settings['link_whitelist'])
-            if not is_whitelisted:
+            if not self.is_whitelisted_url(url):
                 # Additional checks for suspicious patterns
-                if await self.is_suspicious_url(url):
+                if self.is_suspicious_url(url):
                     return True
         
         return False
     
-    async def check_invites(self, message):
-        """Check for Discord invites"""
-        content = message.content
-        
-        # Discord invite patterns
-        invite_patterns = [
-            r'discord\.gg/\w+',
-            r'discordapp\.com/invite/\w+',
-            r'discord\.com/invite/\w+'
-        ]
-        
-        for pattern in invite_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
-                return True
+    def is_whitelisted_url(self, url):
+        """Check if the URL's host is a whitelisted domain or a subdomain of one"""
+        try:
+            host = urlsplit(url).hostname
+        except ValueError:
+            return False
+        if not host:
+            return False
         
-        return False
+        # One set lookup per suffix: a.b.youtube.com, b.youtube.com, youtube.com, com
+        labels = host.rstrip('.').split('.')
+        whitelist = self._link_whitelist
+        return any('.'.join(labels[i:]) in whitelist for i in range(len(labels)))
+    
+    def check_invites(self, scan):
+        """Check for Discord invites"""
+        # discord.gg, discord.com and discordapp.com invite links
+        return scan['invite']
     
-    async def check_mentions(self, message):
+    def check_mentions(self, message):
         """Check for excessive mentions"""
         return len(message.mentions) > self.settings['max_mentions']
     
-    async def check_emojis(self, message):
+    def check_emojis(self, message, scan):
         """Check for excessive emojis"""
         content = message.content
+        max_emojis = self.settings['max_emojis']
         
-        # Count Unicode emojis and custom emojis
-        unicode_emoji_count = len(re.findall(r'[\U00010000-\U0010ffff]', content))
-        custom_emoji_count = len(re.findall(r'<:\w+:\d+>', content))
+        # Every emoji takes at least one character
+        if len(content) <= max_emojis:
+            return False
         
-        total_emojis = unicode_emoji_count + custom_emoji_count
+        # Characters outside the BMP, where Unicode emojis live, take two UTF-16 code units
+        unicode_emoji_count = (len(content.encode('utf-16-le', 'surrogatepass')) >> 1) - len(content)
         
-        return total_emojis > self.settings['max_emojis']
+        return unicode_emoji_count + scan['custom_emojis'] > max_emojis
     
-    async def check_bad_words(self, message):
+    def check_bad_words(self, message):
         """Check for inappropriate content"""
-        content = message.content.lower()
-        
-        for word in self.settings['bad_words']:
-            if word in content:
-                return True
-        
-        return False
+        return self._bad_words_re.search(message.content) is not None
+    
+    @staticmethod
+    def _compile_bad_words(words):
+        """One pattern matching any of the bad words as a whole word, so a message is scanned once"""
+        if not words:
+            return re.compile(r'(?!)')  # Never matches
+        # Lookarounds rather than \b, which misbehaves on words that start or end with punctuation
+        alternation = '|'.join(re.escape(word) for word in words)
+        return re.compile(rf'(?<!\w)(?:{alternation})(?!\w)', re.IGNORECASE)
     
-    async def is_suspicious_url(self, url):
+    def is_suspicious_url(self, url):
         """Check if URL is suspicious"""
-        suspicious_patterns = [
-            r'bit\.ly',
-            r'tinyurl\.com',
-            r'goo\.gl',
-            r't\.co',
-            r'discord-gift',
-            r'discordapp-gift',
-            r'nitro-gift'
-        ]
-        
-        for pattern in suspicious_patterns:
-            if re.search(pattern, url, re.IGNORECASE):
-                return True
-        
-        return False
+        # URL shorteners and fake Nitro gift domains
+        return SUSPICIOUS_URL_RE.search(url) is not None
     
     async def handle_violations(self, message, violations):
         """Handle detected violations"""
@@ -247,7 +362,9 @@ class AutoModerationSystem:
             'timestamp': datetime.utcnow().isoformat()
         }
         
-        self.db.log_automod_violation(violation_data)
+        self._violation_buffer.append(violation_data)
+        if len(self._violation_buffer) >= VIOLATION_FLUSH_SIZE:
+            self.write_violations()
         
         # Determine action based on violation count
         violation_count = self.user_violations[user_id]
@@ -297,57 +414,84 @@ class AutoModerationSystem:
                 inline=False
             )
             
-            warning_msg = await channel.send(embed=embed)
-            
-            # Auto-delete warning after 30 seconds
-            await asyncio.sleep(30)
-            try:
-                await warning_msg.delete()
-            except discord.NotFound:
-                pass
+            # Auto-delete warning after 30 seconds, without holding up the caller
+            await channel.send(embed=embed, delete_after=30)
                 
         except discord.Forbidden:
             logger.warning(f"Cannot send warning in {channel}")
     
-    def is_user_in_cooldown(self, user_id):
+    def is_user_in_cooldown(self, user_id, now=None):
         """Check if user is in cooldown"""
-        if user_id in self.cooldowns:
-            return datetime.utcnow() < self.cooldowns[user_id]
-        return False
+        deadline = self.cooldowns.get(user_id)
+        if deadline is None:
+            return False
+        return (time.monotonic() if now is None else now) < deadline
     
     def set_user_cooldown(self, user_id, seconds):
         """Set user cooldown"""
-        self.cooldowns[user_id] = datetime.utcnow() + timedelta(seconds=seconds)
+        self.cooldowns[user_id] = time.monotonic() + seconds
     
     @tasks.loop(minutes=30)
     async def cleanup_task(self):
         """Clean up old data"""
-        now = datetime.utcnow()
-        
-        # Clean up old messages from cache
-        for user_id in list(self.message_cache.keys()):
-            messages = self.message_cache[user_id]
-            # Keep only messages from last hour
-            self.message_cache[user_id] = deque([
-                msg for msg in messages
-                if (now - msg['timestamp']).total_seconds() <= 3600
-            ], maxlen=10)
+        now = time.monotonic()
+        
+        # Clean up old messages from cache, keeping only the last hour
+        cutoff = now - 3600
+        idle_users = []
+        for user_id, history in self.message_cache.items():
+            # Histories are oldest first, so an old newest message means the user has gone quiet
+            if not history or history[-1].timestamp < cutoff:
+                idle_users.append(user_id)
+                continue
+            counts = self.content_counts[user_id]
+            while history[0].timestamp < cutoff:
+                self._forget_oldest(history, counts)
+        
+        # Forget quiet users entirely rather than keeping empty histories around
+        for user_id in idle_users:
+            del self.message_cache[user_id]
+            self.content_counts.pop(user_id, None)
+        
+        # Clean up expired admin checks
+        self._admin_cache = {key: cached for key, cached in self._admin_cache.items() if now < cached[1]}
         
         # Clean up old cooldowns
-        expired_cooldowns = [
-            user_id for user_id, cooldown_time in self.cooldowns.items()
-            if now >= cooldown_time
-        ]
-        for user_id in expired_cooldowns:
-            del self.cooldowns[user_id]
+        self.cooldowns = {user_id: deadline for user_id, deadline in self.cooldowns.items() if now < deadline}
         
         # Reset violation counts periodically
-        if now.minute == 0:  # Every hour
+        if datetime.utcnow().minute == 0:  # Every hour
             self.user_violations.clear()
     
+    @tasks.loop(seconds=VIOLATION_FLUSH_SECONDS)
+    async def flush_violations(self):
+        """Write buffered violations to the database"""
+        self.write_violations()
+    
+    @flush_violations.after_loop
+    async def after_flush_violations(self):
+        """Write anything still buffered when the loop stops"""
+        self.write_violations()
+    
+    def write_violations(self):
+        """Write every buffered violation in a single database call"""
+        if not self._violation_buffer:
+            return
+        batch, self._violation_buffer = self._violation_buffer, []
+        # Stays on the event loop like every other access to the violations file, so none of them interleave
+        try:
+            self.db.log_automod_violations(batch)
+        except Exception as e:
+            # Retrying wouldn't help with anything the database lets through, so don't let it stop the flush loop
+            logger.error(f"Error logging {len(batch)} auto-mod violations: {e}")
+    
     def update_settings(self, new_settings):
-        """Update auto-moderation settings"""
+        """Update auto-moderation settings; each *_filter key, bad_words_filter included, toggles one check"""
         self.settings.update(new_settings)
+        if 'bad_words' in new_settings:
+            self._bad_words_re = self._compile_bad_words(self.settings['bad_words'])
+        if 'link_whitelist' in new_settings:
+            self._link_whitelist = frozenset(domain.lower() for domain in self.settings['link_whitelist'])
         logger.info("Auto-moderation settings updated")
     
     def get_settings(self):
@@ -201,6 +201,18 @@ class Database:
         self._write_json(self.automod_file, violations)
         logger.info(f"Auto-mod violation logged for user {violation_data['user_id']}")
     
+    def log_automod_violations(self, violations_data):
+        """Log a batch of auto-moderation violations with a single write"""
+        if not violations_data:
+            return
+        violations = self._read_json(self.automod_file)
+        if not isinstance(violations, list):
+            logger.error(f"Dropping {len(violations_data)} auto-mod violations: {self.automod_file} doesn't hold a list")
+            return
+        violations.extend(violations_data)
+        self._write_json(self.automod_file, violations)
+        logger.info(f"Logged {len(violations_data)} auto-mod violations")
+    
     def get_automod_violations(self, user_id=None, guild_id=None, days=30):
         """Get auto-moderation violations"""
         violations = self._read_json(self.automod_file)
@@ -46,7 +46,7 @@ class EngagementAnalyticsCog(commands.Cog):
             # Create animated title
             animated_title = "📊 Community Engagement Summary"
             if hasattr(self.bot, 'status_manager'):
-                animated_title = await self.bot.status_manager.create_animated_embed_title(
+                animated_title = self.bot.status_manager.create_animated_embed_title(
                     "Community Engagement Summary", 'pulsing'
                 )
             
@@ -150,7 +150,7 @@ class EngagementAnalyticsCog(commands.Cog):
             # Create animated title
             animated_title = "🗺️ Conversation Flow Analysis"
             if hasattr(self.bot, 'status_manager'):
-                animated_title = await self.bot.status_manager.create_animated_embed_title(
+                animated_title = self.bot.status_manager.create_animated_embed_title(
                     "Conversation Flow Analysis", 'bouncing'
                 )
             
@@ -274,7 +274,7 @@ class EngagementAnalyticsCog(commands.Cog):
             # Create animated title
             animated_title = "🔍 Narrative Insights"
             if hasattr(self.bot, 'status_manager'):
-                animated_title = await self.bot.status_manager.create_animated_embed_title(
+                animated_title = self.bot.status_manager.create_animated_embed_title(
                     "Narrative Insights", 'search'
                 )
             
@@ -426,7 +426,7 @@ class EngagementAnalyticsCog(commands.Cog):
             # Create animated title
             animated_title = "🏆 Engagement Leaderboard"
             if hasattr(self.bot, 'status_manager'):
-                animated_title = await self.bot.status_manager.create_animated_embed_title(
+                animated_title = self.bot.status_manager.create_animated_embed_title(
                     "Engagement Leaderboard", 'celebration'
                 )
             
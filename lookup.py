@@ -82,7 +82,7 @@ class LookupCog(commands.Cog):
         # Create animated title
         animated_title = f"🎵 {track['name']}"
         if hasattr(self.bot, 'status_manager'):
-            animated_title = await self.bot.status_manager.create_animated_embed_title(track['name'], 'musical')
+            animated_title = self.bot.status_manager.create_animated_embed_title(track['name'], 'musical')
         
         embed = create_embed(
             animated_title,
@@ -156,7 +156,7 @@ class LookupCog(commands.Cog):
         # Create animated title
         animated_title = f"📚 {title}"
         if hasattr(self.bot, 'status_manager'):
-            animated_title = await self.bot.status_manager.create_animated_embed_title(title, 'books')
+            animated_title = self.bot.status_manager.create_animated_embed_title(title, 'books')
         
         embed = create_embed(
             animated_title,
@@ -255,7 +255,7 @@ class LookupCog(commands.Cog):
         # Create animated title
         animated_title = f"📖 {title}"
         if hasattr(self.bot, 'status_manager'):
-            animated_title = await self.bot.status_manager.create_animated_embed_title(title, 'pulsing')
+            animated_title = self.bot.status_manager.create_animated_embed_title(title, 'pulsing')
         
         embed = create_embed(
             animated_title,
@@ -14,6 +14,12 @@ class ModerationCog(commands.Cog):
         self.muted_users = {}  # Store muted users temporarily
         self.auto_mod = AutoModerationSystem(bot)
     
+    @commands.Cog.listener()
+    async def on_member_update(self, before, after):
+        """Re-check admin status on the member's next message when their roles change"""
+        if before.roles != after.roles:
+            self.auto_mod.forget_admin_status(after.guild.id, after.id)
+    
     def has_mod_permissions():
         """Check if user has moderation permissions"""
         async def predicate(interaction: discord.Interaction):
@@ -331,7 +337,8 @@ class ModerationCog(commands.Cog):
                 f"Suspicious Links: {'✅' if settings['link_filter'] else '❌'}",
                 f"Discord Invites: {'✅' if settings['invite_filter'] else '❌'}",
                 f"Excessive Mentions: {'✅' if settings['mention_filter'] else '❌'}",
-                f"Excessive Emojis: {'✅' if settings['emoji_filter'] else '❌'}"
+                f"Excessive Emojis: {'✅' if settings['emoji_filter'] else '❌'}",
+                f"Inappropriate Content: {'✅' if settings['bad_words_filter'] else '❌'}"
             ]
             
             embed.add_field(